@@ -2,22 +2,388 @@
 import streamlit as st
 import os
 import json
-# Attempt to load .env file automatically if python-dotenv is installed
-try:
-    from dotenv import load_dotenv
+import asyncio
+import functools
+import hashlib
+import re
+import time
+from collections import OrderedDict, deque
+from typing import List, Optional
+_ENV_LOADED = False
+
+
+def _ensure_env() -> None:
+    """Load .env (and `file.env`, where some users keep credentials) once per process, if python-dotenv is installed."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
+    try:
+        from dotenv import load_dotenv
+    except Exception:
+        return
     # Load default .env
     load_dotenv()
-    # Also attempt to load `file.env` if present in the repo (some users keep credentials there)
     env_path = os.path.join(os.path.dirname(__file__), "file.env")
     if os.path.exists(env_path):
         load_dotenv(env_path)
+
+
+_ensure_env()
+# Resolved once; read by every analysis entry point
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+
+# numpy (installed with pandas) backs the semantic cache's cosine checks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except Exception:
+    NUMPY_AVAILABLE = False
+
+# Optional BPE tokenizer used as a cheap proxy for Gemini input tokens
+try:
+    import tiktoken
+    _TOKENIZER = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _TOKENIZER = None
+
+# Import the provider SDK once; the module stays importable when it isn't installed
+try:
+    from google import genai
+    from google.genai import types
+    GENAI_AVAILABLE = True
+except Exception:
+    genai = None
+    types = None
+    GENAI_AVAILABLE = False
+
+# orjson parses/serializes the analysis payloads faster; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(text):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps(obj) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+# Pydantic ships with google-genai; used to validate/normalize model output against the schema
+try:
+    from pydantic import BaseModel, Field
+    PYDANTIC_AVAILABLE = True
+except Exception:
+    PYDANTIC_AVAILABLE = False
+
+# Patterns used by the local (no-LLM) fallback, compiled once at import
+_EMAIL_RE = re.compile(r"[\w\.-]+@[\w\.-]+")
+_PHONE_RE = re.compile(r"(\+?\d[\d\s\-()]{7,}\d)")
+_NAME_RE = re.compile(r"^[A-Z][a-z]+\s+[A-Z][a-z]+$")
+_WHITESPACE_RE = re.compile(r"\s+")
+# Resume lines that carry no information for the model (page footers, stock phrases)
+_BOILERPLATE_LINE_RE = re.compile(
+    r"^\s*(?:page\s+\d+(?:\s+of\s+\d+)?|-\s*\d+\s*-|curriculum vitae|resume|cv|references available (?:up)?on request\.?)\s*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Completed top-level string fields inside a still-streaming JSON response
+_PARTIAL_FIELD_RE = re.compile(r'"(name|email|phone)"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+GEMINI_MODEL = 'gemini-2.5-flash'
+# Bump whenever ANALYSIS_SCHEMA or the prompt changes so stale cached responses are not reused
+SCHEMA_VERSION = 3
+RESUME_MAX_TOKENS = 4000
+RESPONSE_CACHE_TTL = 86400  # seconds
+RESPONSE_CACHE_MAXSIZE = 512
+
+# In-process exact-match cache of raw LLM responses, oldest use first: key -> (stored_at, response_text)
+_RESPONSE_CACHE = OrderedDict()
+
+
+def _response_cache_key(prompt: str) -> str:
+    """Content-addressed key for a prompt sent to the model."""
+    h = hashlib.sha256()
+    for part in (GEMINI_MODEL, str(SCHEMA_VERSION), prompt):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _get_cached_response(key: str):
+    """Return the cached response text for `key`, or None on miss/expiry."""
+    entry = _RESPONSE_CACHE.get(key)
+    if entry is None:
+        return None
+    stored_at, text = entry
+    if time.time() - stored_at > RESPONSE_CACHE_TTL:
+        _RESPONSE_CACHE.pop(key, None)
+        return None
+    _RESPONSE_CACHE.move_to_end(key)
+    return text
+
+
+def _store_cached_response(key: str, text: str) -> None:
+    _RESPONSE_CACHE[key] = (time.time(), text)
+    _RESPONSE_CACHE.move_to_end(key)
+    while len(_RESPONSE_CACHE) > RESPONSE_CACHE_MAXSIZE:
+        _RESPONSE_CACHE.popitem(last=False)
+
+
+# Optional semantic cache: collapse near-duplicate resume uploads onto one LLM call.
+# Uses sentence-transformers embeddings when installed, otherwise whitespace/case-normalized text.
+try:
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = NUMPY_AVAILABLE
 except Exception:
-    pass
+    SEMANTIC_CACHE_AVAILABLE = False
+
+SEMANTIC_MODEL_NAME = "all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_MAXSIZE = 256  # bounds memory and the linear scan per lookup; oldest entries are dropped first
+_SEMANTIC_MODEL = None
+# Entries of (stored_at, request_key, resume_embedding_or_normalized_text, response_text), oldest first
+_SEMANTIC_CACHE = deque(maxlen=SEMANTIC_CACHE_MAXSIZE)
+
+
+def _semantic_fingerprint(raw_text: str):
+    """Embedding (normalized) of the resume text, or its canonical text when embeddings are unavailable."""
+    global _SEMANTIC_MODEL
+    text = _WHITESPACE_RE.sub(" ", raw_text[:10000]).strip().lower()
+    if not SEMANTIC_CACHE_AVAILABLE:
+        return text
+    try:
+        if _SEMANTIC_MODEL is None:
+            _SEMANTIC_MODEL = SentenceTransformer(SEMANTIC_MODEL_NAME)
+        return _SEMANTIC_MODEL.encode(text, normalize_embeddings=True)
+    except Exception:
+        return text
+
+
+def _semantic_key(job_description: str) -> str:
+    """Everything besides the resume that shapes the response: model, schema/prompt version, job description."""
+    return _response_cache_key(_build_prompt("", job_description))
+
+
+def _semantic_lookup(fingerprint, job_description: str):
+    """Return cached response text for a near-duplicate resume with the same job description."""
+    # Entries are appended in time order, so expired ones are all at the left
+    expire_before = time.time() - RESPONSE_CACHE_TTL
+    while _SEMANTIC_CACHE and _SEMANTIC_CACHE[0][0] < expire_before:
+        _SEMANTIC_CACHE.popleft()
+    key = _semantic_key(job_description)
+    for _, entry_key, entry_fp, text in _SEMANTIC_CACHE:
+        if entry_key != key or type(entry_fp) is not type(fingerprint):
+            continue
+        if isinstance(fingerprint, str):
+            if entry_fp == fingerprint:
+                return text
+        elif float(np.dot(entry_fp, fingerprint)) >= SEMANTIC_CACHE_THRESHOLD:
+            return text
+    return None
+
+
+def _semantic_store(fingerprint, job_description: str, text: str) -> None:
+    _SEMANTIC_CACHE.append((time.time(), _semantic_key(job_description), fingerprint, text))
+
+
+def _prune(text: str, max_tokens: int = RESUME_MAX_TOKENS) -> str:
+    """Strip boilerplate and whitespace, then truncate to roughly `max_tokens` input tokens."""
+    text = _BOILERPLATE_LINE_RE.sub("", text)
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+    if _TOKENIZER is not None:
+        tokens = _TOKENIZER.encode(text)
+        return _TOKENIZER.decode(tokens[:max_tokens]) if len(tokens) > max_tokens else text
+    # ~4 characters per token; cut on a word boundary
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind(" ", 0, max_chars)
+    return text[:cut if cut > 0 else max_chars]
+
+
+def _build_prompt(raw_text: str, job_description: str = "") -> str:
+    return (
+        "You are an expert career platform AI. Analyze the following resume text and perform two tasks: "
+        "1. Structured Extraction: Extract the candidate's full profile, skills, and assign proficiency levels (Beginner, Intermediate, Expert). "
+        "2. Mock Matching: Based on the candidate's profile, generate a mock 'match_score' (0-100) and a brief justification for the following job:\n"
+        f"{job_description or 'Senior Software Engineer'}\n"
+        "Return the output strictly in the specified JSON schema."
+        f"\n\nRESUME TEXT:\n{_prune(raw_text)}"
+    )
+
+
+def _lookup_cached_analysis(prompt: str, raw_text: str, job_description: str):
+    """Check the exact-match then the near-duplicate cache.
+
+    Returns (cached_text_or_None, cache_key, fingerprint) so a miss can be stored afterwards.
+    """
+    # Identical resume + job description: reuse the previous response instead of re-calling the model
+    cache_key = _response_cache_key(prompt)
+    cached_text = _get_cached_response(cache_key)
+    if cached_text is not None:
+        return cached_text, cache_key, None
+
+    # Same resume with formatting differences: reuse the response of the near-duplicate
+    fingerprint = _semantic_fingerprint(raw_text)
+    cached_text = _semantic_lookup(fingerprint, job_description)
+    if cached_text is not None:
+        _store_cached_response(cache_key, cached_text)
+    return cached_text, cache_key, fingerprint
+
+
+def _remember_analysis(cache_key: str, fingerprint, job_description: str, text: str) -> None:
+    _store_cached_response(cache_key, text)
+    if fingerprint is not None:
+        _semantic_store(fingerprint, job_description, text)
+
+
+# Response schema as a plain JSON Schema dict: built once, no SDK objects, safe to pickle/serialize
+_STRING = {"type": "string"}
+_ANALYSIS_SCHEMA_DICT = {
+    "type": "object",
+    "properties": {
+        "core_profile": {
+            "type": "object",
+            "properties": {
+                "name": _STRING,
+                "email": _STRING,
+                "phone": _STRING,
+                "summary": _STRING,
+                "education": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"degree": _STRING, "institution": _STRING, "year": _STRING},
+                        "required": ["degree", "institution"],
+                    },
+                },
+            },
+            "required": ["name", "email", "summary"],
+        },
+        "technical_expertise": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"skill": _STRING, "proficiency": _STRING, "keywords": {"type": "array", "items": _STRING}},
+                "required": ["skill", "proficiency"],
+            },
+        },
+        "job_match_analysis": {
+            "type": "object",
+            "properties": {"match_score": {"type": "integer"}, "justification": _STRING},
+        },
+    },
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _skill_matcher(skills: tuple):
+    """Distinct skills as token tuples (same tokenizer as the JD), built once per skill set."""
+    from resume_analysis import tokenize
+
+    return tuple(dict.fromkeys(tuple(tokenize(skill)) for skill in skills if tokenize(skill)))
+
+
+def _count_skill_overlap(skills, job_description: str) -> int:
+    """Number of distinct skills that occur as whole tokens (case-insensitively) in the job description."""
+    if not skills or not job_description:
+        return 0
+    from resume_analysis import tokenize
+
+    # One tokenization pass over the JD; single-word skills are set lookups,
+    # multi-word skills ("machine learning") are matched as consecutive tokens
+    jd_tokens = tokenize(job_description)
+    vocab = set(jd_tokens)
+    joined = f" {' '.join(jd_tokens)} "
+    return sum(
+        1 for skill in _skill_matcher(tuple(skills))
+        if (skill[0] in vocab if len(skill) == 1 else f" {' '.join(skill)} " in joined)
+    )
+
+
+if PYDANTIC_AVAILABLE:
+    # Mirrors ANALYSIS_SCHEMA; defaults let partially filled responses through instead of failing the call
+    class Education(BaseModel):
+        degree: str
+        institution: str
+        year: Optional[str] = None
+
+    class CoreProfile(BaseModel):
+        name: str = "Unknown"
+        email: str = "N/A"
+        phone: str = "N/A"
+        summary: str = ""
+        education: List[Education] = []
+
+    class Expertise(BaseModel):
+        skill: str
+        proficiency: str = "Beginner"
+        keywords: List[str] = []
+
+    class JobMatchAnalysis(BaseModel):
+        match_score: int = 0
+        justification: str = ""
+
+    class Analysis(BaseModel):
+        core_profile: CoreProfile = Field(default_factory=CoreProfile)
+        technical_expertise: List[Expertise] = []
+        job_match_analysis: JobMatchAnalysis = Field(default_factory=JobMatchAnalysis)
+
+
+def _parse_analysis(text: str) -> dict:
+    """Parse a model response into the analysis dict; raises ValueError when it doesn't fit the schema."""
+    if PYDANTIC_AVAILABLE:
+        return Analysis.model_validate_json(text).model_dump()
+    return _json_loads(text)
+
+
+# Built once and reused so every call shares the same schema/config objects
+ANALYSIS_SCHEMA = types.Schema.model_validate(_ANALYSIS_SCHEMA_DICT) if GENAI_AVAILABLE else None
+ANALYSIS_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=ANALYSIS_SCHEMA,
+) if GENAI_AVAILABLE else None
+
+@st.cache_resource(show_spinner=False)
+def _get_client():
+    """Process-wide Gemini client, created on first use so its connection pool is reused across calls and reruns.
+
+    Only for the sync calls: its async transport binds to the first event loop it runs on,
+    so run_analysis_concurrent makes its own client per asyncio.run.
+    """
+    return genai.Client(api_key=GEMINI_API_KEY)
+
+
+def _partial_profile_fields(buffer: str) -> dict:
+    """Pull core_profile fields that have fully arrived out of a partial JSON buffer."""
+    fields = {}
+    for m in _PARTIAL_FIELD_RE.finditer(buffer):
+        if m.group(1) not in fields:
+            try:
+                fields[m.group(1)] = json.loads(f'"{m.group(2)}"')
+            except ValueError:
+                fields[m.group(1)] = m.group(2)
+    return fields
+
+
+def _repair_analysis(bad_text: str, error: Exception) -> dict:
+    """Ask the model to fix only the invalid fields of a response instead of redoing the whole analysis."""
+    prompt = (
+        "The following JSON does not match the required schema. Fix only the fields named in the errors, "
+        "keep every other value unchanged, and return the corrected JSON."
+        f"\n\nERRORS:\n{error}\n\nJSON:\n{bad_text}"
+    )
+    response = _get_client().models.generate_content(model=GEMINI_MODEL, contents=prompt, config=ANALYSIS_CONFIG)
+    return _parse_analysis(response.text)
+
 
-from dotenv import load_dotenv
-print("GEMINI_API_KEY loaded:", os.getenv("GEMINI_API_KEY")) 
-load_dotenv()
-api_key = os.getenv("GEMINI_API_KEY")
 BLANK_ANALYSIS_DATA = {
     "core_profile": {"name": "Analysis Failed", "email": "N/A", "phone": "N/A", "summary": "Error: Check GEMINI_API_KEY and raw PDF text.", "education": []},
     "technical_expertise": [],
@@ -30,8 +396,7 @@ def run_analysis(raw_text: str, job_description: str = ""):
     st.info("Step 2: Running multi-step AI analysis (LLM) - checking environment...")
 
     # Check for API key first
-    gemini_key = os.getenv("GEMINI_API_KEY")
-    if not gemini_key:
+    if not GEMINI_API_KEY:
         # Provide a helpful message in the UI and fall back to a local heuristic analysis.
         st.warning("GEMINI_API_KEY not found. Falling back to local heuristic analysis (no LLM). Set GEMINI_API_KEY to enable Gemini-based analysis.")
         # Local fallback: use resume_analysis functions to build a reasonable structured output
@@ -47,20 +412,19 @@ def run_analysis(raw_text: str, job_description: str = ""):
             name = "Unknown"
             email = "N/A"
             phone = "N/A"
-            import re
             # email
-            m = re.search(r"[\w\.-]+@[\w\.-]+", raw_text)
+            m = _EMAIL_RE.search(raw_text)
             if m:
                 email = m.group(0)
             # phone (simple patterns)
-            m = re.search(r"(\+?\d[\d\s\-()]{7,}\d)", raw_text)
+            m = _PHONE_RE.search(raw_text)
             if m:
                 phone = m.group(0)
             # name: look for a line at the top with two capitalized words
             lines = [l.strip() for l in raw_text.splitlines() if l.strip()]
             if lines:
                 first = lines[0]
-                if re.match(r"^[A-Z][a-z]+\s+[A-Z][a-z]+$", first):
+                if _NAME_RE.match(first):
                     name = first
 
             # technical_expertise array
@@ -73,11 +437,7 @@ def run_analysis(raw_text: str, job_description: str = ""):
                 })
 
             # Simple matching: count overlap between job_description keywords and skills
-            jd = (job_description or "").lower()
-            overlap = 0
-            for s in skills:
-                if s.lower() in jd:
-                    overlap += 1
+            overlap = _count_skill_overlap(skills, job_description)
             match_score = min(100, int((overlap / max(1, len(skills))) * 100)) if skills else 0
             justification = f"Local heuristic match: {overlap} skill(s) matched out of {len(skills)} detected skills."
 
@@ -90,72 +450,197 @@ def run_analysis(raw_text: str, job_description: str = ""):
             st.error(f"Local analysis fallback failed: {e}")
             return BLANK_ANALYSIS_DATA
 
-    # Import the provider client lazily so the module can be imported even when the SDK isn't installed
+    prompt = _build_prompt(raw_text, job_description)
+    cached_text, cache_key, fingerprint = _lookup_cached_analysis(prompt, raw_text, job_description)
+    if cached_text is not None:
+        return _json_loads(cached_text)
+
+    if not GENAI_AVAILABLE:
+        st.error("Required LLM SDK 'google-genai' not available. Install it or run without LLM integration.")
+        return BLANK_ANALYSIS_DATA
+
     try:
-        from google import genai
-        from google.genai import types
+        # Stream the response so the first profile fields show up before generation finishes
+        progress = st.empty()
+        chunks = []
+        shown = {}
+        for chunk in _get_client().models.generate_content_stream(
+            model=GEMINI_MODEL,
+            contents=prompt,
+            config=ANALYSIS_CONFIG,
+        ):
+            if not chunk.text:
+                continue
+            chunks.append(chunk.text)
+            partial = _partial_profile_fields("".join(chunks))
+            if partial != shown:
+                shown = partial
+                progress.info("Receiving analysis... " + " | ".join(f"{k.title()}: {v}" for k, v in shown.items()))
+        progress.empty()
+
+        response_text = "".join(chunks)
+        try:
+            result = _parse_analysis(response_text)
+        except ValueError as e:
+            st.warning("LLM output did not match the schema; requesting a targeted repair...")
+            result = _repair_analysis(response_text, e)
+        _remember_analysis(cache_key, fingerprint, job_description, _json_dumps(result))
+        return result
+
     except Exception as e:
-        st.error("Required LLM SDK 'google-genai' not available. Install it or run without LLM integration.")
+        st.error(f"LLM API Error: {e}")
         return BLANK_ANALYSIS_DATA
 
-    # Build schema only when SDK is available
-    ANALYSIS_SCHEMA = types.Schema(
-        type=types.Type.OBJECT,
-        properties={
-            "core_profile": types.Schema(
-                type=types.Type.OBJECT,
-                properties={
-                    "name": types.Schema(type=types.Type.STRING),
-                    "email": types.Schema(type=types.Type.STRING),
-                    "phone": types.Schema(type=types.Type.STRING),
-                    "summary": types.Schema(type=types.Type.STRING),
-                    "education": types.Schema(
-                        type=types.Type.ARRAY,
-                        items=types.Schema(
-                            type=types.Type.OBJECT,
-                            properties={"degree": types.Schema(type=types.Type.STRING), "institution": types.Schema(type=types.Type.STRING), "year": types.Schema(type=types.Type.STRING)},
-                            required=["degree", "institution"],
-                        ),
-                    ),
-                },
-                required=["name", "email", "summary"],
-            ),
-            "technical_expertise": types.Schema(
-                type=types.Type.ARRAY,
-                items=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={"skill": types.Schema(type=types.Type.STRING), "proficiency": types.Schema(type=types.Type.STRING), "keywords": types.Schema(type=types.Type.ARRAY, items=types.Schema(type=types.Type.STRING))},
-                    required=["skill", "proficiency"],
-                ),
-            ),
-            "job_match_analysis": types.Schema(
-                type=types.Type.OBJECT,
-                properties={"match_score": types.Schema(type=types.Type.INTEGER), "justification": types.Schema(type=types.Type.STRING)},
-            ),
-        },
-    )
 
-    client = genai.Client()
-    prompt = (
-        "You are an expert career platform AI. Analyze the following resume text and perform two tasks: "
-        "1. Structured Extraction: Extract the candidate's full profile, skills, and assign proficiency levels (Beginner, Intermediate, Expert). "
-        "2. Mock Matching: Based on the candidate's profile, generate a mock 'match_score' (0-100) and a brief justification for the following job:\n"
-        f"{job_description or 'Senior Software Engineer'}\n"
-        "Return the output strictly in the specified JSON schema."
-        f"\n\nRESUME TEXT:\n{raw_text[:10000]}"
-    )
+def _split_cached(items):
+    """Resolve cache hits for a list of (raw_text, job_description) pairs.
+
+    Returns (results, pending) where results holds parsed hits (None for misses) and
+    pending lists (index, job_description, prompt, cache_key, fingerprint) for each miss.
+    """
+    results = [None] * len(items)
+    pending = []
+    for idx, (raw_text, job_description) in enumerate(items):
+        prompt = _build_prompt(raw_text, job_description)
+        cached_text, cache_key, fingerprint = _lookup_cached_analysis(prompt, raw_text, job_description)
+        if cached_text is not None:
+            results[idx] = _json_loads(cached_text)
+        else:
+            pending.append((idx, job_description, prompt, cache_key, fingerprint))
+    return results, pending
+
+
+GEMINI_MAX_CONCURRENCY = 5
+GEMINI_MAX_RETRIES = 6
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    return getattr(error, "code", None) == 429 or "429" in str(error) or "RESOURCE_EXHAUSTED" in str(error)
+
+
+async def _generate_with_retry(client, prompt: str, config, sem: asyncio.Semaphore):
+    """One async Gemini call, bounded by `sem`, with exponential backoff on 429s."""
+    async with sem:
+        for attempt in range(GEMINI_MAX_RETRIES):
+            try:
+                return await client.aio.models.generate_content(model=GEMINI_MODEL, contents=prompt, config=config)
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt == GEMINI_MAX_RETRIES - 1:
+                    raise
+                await asyncio.sleep(10 * 2 ** attempt)
+
+
+def run_analysis_concurrent(items, max_concurrency: int = GEMINI_MAX_CONCURRENCY):
+    """
+    Analyze several (raw_text, job_description) pairs with concurrent Gemini calls
+    (at most `max_concurrency` in flight). Low-latency alternative to `run_analysis_batch`
+    for interactive multi-resume uploads. Results are returned in input order.
+    """
+    items = list(items)
+    if len(items) <= 1 or not GEMINI_API_KEY:
+        return [run_analysis(raw_text, job_description) for raw_text, job_description in items]
+
+    st.info(f"Step 2: Running multi-step AI analysis (LLM) for {len(items)} resumes...")
+
+    results, pending = _split_cached(items)
+    if not pending:
+        return results
+
+    if not GENAI_AVAILABLE:
+        st.error("Required LLM SDK 'google-genai' not available. Install it or run without LLM integration.")
+        return [r if r is not None else BLANK_ANALYSIS_DATA for r in results]
+
+    async def _run_all():
+        # Fresh client per event loop; closed before asyncio.run tears the loop down
+        client = genai.Client(api_key=GEMINI_API_KEY)
+        sem = asyncio.Semaphore(max_concurrency)
+        try:
+            return await asyncio.gather(
+                *[_generate_with_retry(client, prompt, ANALYSIS_CONFIG, sem) for _, _, prompt, _, _ in pending],
+                return_exceptions=True,
+            )
+        finally:
+            await client.aio.aclose()
+
+    responses = asyncio.run(_run_all())
+
+    for (idx, job_description, _, cache_key, fingerprint), response in zip(pending, responses):
+        try:
+            if isinstance(response, Exception):
+                raise response
+            results[idx] = _parse_analysis(response.text)
+        except Exception as e:
+            st.error(f"LLM API Error for resume #{idx + 1}: {e}")
+            continue
+        _remember_analysis(cache_key, fingerprint, job_description, _json_dumps(results[idx]))
+
+    return [r if r is not None else BLANK_ANALYSIS_DATA for r in results]
+
+
+_BATCH_DONE_STATES = {"JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+
+
+def run_analysis_batch(items, poll_interval: float = 10.0, max_wait: float = 900.0):
+    """
+    Analyze several (raw_text, job_description) pairs with a single Gemini Batch Mode job.
+    Results are returned in input order. A single item (or no API key) goes through `run_analysis`.
+    A job still running after `max_wait` seconds is cancelled and its items come back as BLANK_ANALYSIS_DATA.
+    """
+    items = list(items)
+    if len(items) <= 1 or not GEMINI_API_KEY:
+        return [run_analysis(raw_text, job_description) for raw_text, job_description in items]
+
+    st.info(f"Step 2: Running batch AI analysis (LLM) for {len(items)} resumes...")
+
+    results, pending = _split_cached(items)
+    if not pending:
+        return results
+
+    if not GENAI_AVAILABLE:
+        st.error("Required LLM SDK 'google-genai' not available. Install it or run without LLM integration.")
+        return [r if r is not None else BLANK_ANALYSIS_DATA for r in results]
+
+    client = _get_client()
+    inline_requests = [
+        {
+            "contents": [{"parts": [{"text": prompt}], "role": "user"}],
+            "config": {"response_mime_type": "application/json", "response_schema": _ANALYSIS_SCHEMA_DICT},
+        }
+        for _, _, prompt, _, _ in pending
+    ]
 
     try:
-        response = client.models.generate_content(
-            model='gemini-2.5-flash',
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                response_mime_type="application/json",
-                response_schema=ANALYSIS_SCHEMA,
-            ),
+        batch_job = client.batches.create(
+            model=GEMINI_MODEL,
+            src=inline_requests,
+            config={"display_name": "resume-analysis"},
         )
-        return json.loads(response.text)
+        deadline = time.time() + max_wait
+        while batch_job.state.name not in _BATCH_DONE_STATES:
+            if time.time() >= deadline:
+                try:
+                    client.batches.cancel(name=batch_job.name)
+                except Exception:
+                    pass
+                raise TimeoutError(f"batch job not finished after {max_wait:.0f}s (state {batch_job.state.name}); cancelled")
+            time.sleep(poll_interval)
+            batch_job = client.batches.get(name=batch_job.name)
+
+        if batch_job.state.name not in ("JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED"):
+            raise RuntimeError(f"batch job finished with state {batch_job.state.name}")
+
+        for (idx, job_description, _, cache_key, fingerprint), inline_response in zip(pending, batch_job.dest.inlined_responses):
+            if inline_response.response is None:
+                st.error(f"LLM API Error for resume #{idx + 1}: {inline_response.error}")
+                continue
+            try:
+                results[idx] = _parse_analysis(inline_response.response.text)
+            except Exception as e:
+                st.error(f"LLM API Error for resume #{idx + 1}: {e}")
+                continue
+            _remember_analysis(cache_key, fingerprint, job_description, _json_dumps(results[idx]))
 
     except Exception as e:
-        st.error(f"LLM API Error: {e}")
-        return BLANK_ANALYSIS_DATA
\ No newline at end of file
+        st.error(f"LLM Batch API Error: {e}")
+
+    return [r if r is not None else BLANK_ANALYSIS_DATA for r in results]
\ No newline at end of file
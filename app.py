@@ -1,30 +1,224 @@
 # app.py
 import streamlit as st
-import pandas as pd
+import hashlib
+import logging
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
 from resume_analysis import extract_text_from_pdf_with_fallback
 
 # --- NECESSARY IMPORTS FOR APP.PY ---
 # The logic for PDF reading is now self-contained, but the
 # analysis file is still required.
-from analysis import run_analysis, BLANK_ANALYSIS_DATA
+from analysis import run_analysis, run_analysis_concurrent, run_analysis_batch, BLANK_ANALYSIS_DATA
 from job_discovery import discover_jobs_for_resume
 from job_scraper import scrape_all_sources
 from job_database import count_jobs
-from dashboard import render_dashboard
+from dashboard import render_dashboard, clear_progress_cache
+
+# job_discovery reports its [CACHE]/[SCRAPER]/... progress through logging; print INFO and up to the
+# console as before. Only that logger, so library INFO chatter (e.g. httpx requests) stays quiet.
+_discovery_log = logging.getLogger("job_discovery")
+if not _discovery_log.handlers:  # the script re-runs on every interaction
+    _discovery_handler = logging.StreamHandler(sys.stdout)
+    _discovery_handler.setFormatter(logging.Formatter("%(message)s"))
+    _discovery_log.addHandler(_discovery_handler)
+    _discovery_log.setLevel(logging.INFO)
 
 # --- INTEGRATED PDF READING FUNCTION (MOVED FROM data_utils.py) ---
+def _extract_pdf_text(pdf_bytes: bytes) -> str:
+    # Parse straight from memory; no temp-file write/read/delete per upload
+    return extract_text_from_pdf_with_fallback(pdf_bytes)
+
+
+@st.cache_resource
+def _pdf_pool() -> ThreadPoolExecutor:
+    """Worker threads for PDF extraction, shared across reruns and sessions."""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+PDF_TEXT_CACHE_MAX_ENTRIES = 8
+
+
+def _pdf_text_cache() -> OrderedDict:
+    """Extracted text keyed on the PDF's SHA-256, so re-analyzing the same file skips extraction.
+
+    Kept per session (one user's resume text is never held in a process-wide cache) and bounded as an LRU.
+    """
+    return st.session_state.setdefault("_pdf_text_cache", OrderedDict())
+
+
+def _remember_pdf_text(cache: OrderedDict, digest: str, text: str) -> None:
+    cache[digest] = text
+    cache.move_to_end(digest)
+    while len(cache) > PDF_TEXT_CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+
+def get_raw_texts_from_pdfs(uploaded_files) -> list:
+    """Extract all uploads on the PDF pool while the page shows progress; texts keep upload order."""
+    cache = _pdf_text_cache()
+    texts = [None] * len(uploaded_files)
+    futures = {}
+    for idx, uploaded_file in enumerate(uploaded_files):
+        pdf_bytes = uploaded_file.getvalue()
+        digest = hashlib.sha256(pdf_bytes).hexdigest()
+        if digest in cache:
+            cache.move_to_end(digest)
+            texts[idx] = cache[digest]
+        else:
+            futures[_pdf_pool().submit(_extract_pdf_text, pdf_bytes)] = (idx, digest)
+
+    if futures:
+        progress = st.progress(0.0, text="Step 1: Extracting text from PDF...")
+        for done, future in enumerate(as_completed(futures), 1):
+            idx, digest = futures[future]
+            try:
+                texts[idx] = future.result()
+                _remember_pdf_text(cache, digest, texts[idx])
+            except Exception as e:
+                st.error(f"Could not read {uploaded_files[idx].name}: {e}")
+                texts[idx] = ""
+            progress.progress(done / len(futures), text=f"Step 1: Extracted {done}/{len(futures)} PDF(s)")
+        progress.empty()
+    return texts
+
+
 def get_raw_text_from_pdf(uploaded_file):
-    import tempfile
-    import os
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        tmp.write(uploaded_file.getbuffer())
-        tmp_path = tmp.name
-    try:
-        text = extract_text_from_pdf_with_fallback(tmp_path)
-    finally:
-        os.remove(tmp_path)
-    return text
+    return get_raw_texts_from_pdfs([uploaded_file])[0]
+
+
+# --- CACHED READS (the script re-runs top to bottom on every widget interaction) ---
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_count_jobs() -> int:
+    return count_jobs()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_discover_jobs(resume_skills: tuple, experience_years: int, min_score_threshold: float):
+    return discover_jobs_for_resume(list(resume_skills), experience_years, min_score_threshold=min_score_threshold)
+
+
+def render_analysis_results(analysis_data):
+    """Render one structured analysis (profile, expertise, match, job discovery)."""
+    # --- DISPLAY RESULTS (MEMBER 1'S CORE TASK) ---
+    st.markdown("---")
+    
+    if analysis_data is not BLANK_ANALYSIS_DATA:
+        st.success("✅ Analysis Complete! Structured Profile & Insights:")
+
+        # Display General Profile
+        st.subheader("2.1 Candidate Core Profile")
+        col1, col2 = st.columns([1, 2])
+        
+        with col1:
+            st.metric(label="Name", value=analysis_data['core_profile']['name'])
+            st.metric(label="Email", value=analysis_data['core_profile']['email'])
+            st.metric(label="Phone", value=analysis_data['core_profile']['phone'])
+        
+        with col2:
+            st.markdown(f"**Summary:**")
+            st.info(analysis_data['core_profile']['summary'])
+        
+        st.markdown("#### Education History")
+        if analysis_data['core_profile']['education']:
+            st.dataframe(analysis_data['core_profile']['education'], hide_index=True)
+        
+        st.markdown("---")
+
+        # Display Technical Expertise
+        st.subheader("2.2 Technical Expertise & Proficiency Levels")
+        
+        if analysis_data['technical_expertise']:
+            expertise_rows = [
+                {
+                    'Skill Area': e.get('skill', ''),
+                    'Proficiency Level': e.get('proficiency', ''),
+                    'Related Tools/Keywords': ", ".join(e.get('keywords') or []),
+                }
+                for e in analysis_data['technical_expertise']
+            ]
+            st.table(expertise_rows)
+        else:
+            st.warning("No technical expertise identified.")
+        
+        st.markdown("---")
+        
+        # Display Job Match Analysis
+        st.subheader("3. Automated Job Discovery & Matching (MVP)")
+        st.markdown("*(Match against the job description provided above)*")
+        
+        match_score = analysis_data['job_match_analysis']['match_score']
+        st.metric(label="Match Score", value=f"{match_score}%", help="Compatibility Score explaining why the job fits.")
+        
+        st.markdown("#### Compatibility Explanation (Justification)")
+        st.code(analysis_data['job_match_analysis']['justification'], language=None)
+        
+        st.markdown("---")
+
+        # Placeholder for Interview Prep
+        st.subheader("4. Deep Research-Powered Interview Preparation")
+        st.warning("Interview Preparation materials (e.g., questions, study guide) will appear here.")
+        
+        st.markdown("---")
+        
+        # --- JOB DISCOVERY & MATCHING ---
+        st.subheader("5. Automated Job Discovery & Matching")
+        st.markdown("Discovering job opportunities based on your skills...")
+        
+        try:
+            # Extract skills from analysis for job matching
+            resume_skills = [skill['skill'] for skill in analysis_data.get('technical_expertise', [])]
+            
+            # Estimate experience years from experience field (simple heuristic)
+            experience_years = 3  # default
+            try:
+                experience_field = analysis_data.get('core_profile', {}).get('summary', '')
+                years_match = __import__('re').search(r'(\d+)\s*(?:\+)?\s*years?', experience_field, __import__('re').IGNORECASE)
+                if years_match:
+                    experience_years = int(years_match.group(1))
+            except:
+                pass
+            
+            # Discover jobs
+            job_results = _cached_discover_jobs(tuple(resume_skills), experience_years, 25.0)
+            
+            st.metric(label="Total Jobs Found", value=job_results['total_jobs_found'])
+            st.metric(label="Matched Jobs", value=job_results['jobs_matched'])
+            
+            if job_results['ranked_jobs']:
+                st.markdown("#### Top Job Matches:")
+                
+                for idx, job in enumerate(job_results['ranked_jobs'][:10], 1):
+                    with st.expander(f"#{idx} {job['title']} at {job['company']} ({job['compatibility_score']}% match)"):
+                        col1, col2 = st.columns([1, 1])
+                        
+                        with col1:
+                            st.markdown(f"**Location:** {job['location']}")
+                            st.markdown(f"**Salary:** {job['salary']}")
+                            st.markdown(f"**Level:** {job['experience_level']}")
+                        
+                        with col2:
+                            st.markdown(f"**Compatibility Score:** {job['compatibility_score']}%")
+                            st.markdown(f"**Matched Skills:** {', '.join(job['compatibility_details']['matched_skills']) if job['compatibility_details']['matched_skills'] else 'None'}")
+                            if job['compatibility_details']['missing_skills']:
+                                st.markdown(f"**Missing Skills:** {', '.join(job['compatibility_details']['missing_skills'])}")
+                        
+                        st.markdown("**Why This Match:**")
+                        st.info(job['justification'])
+                        
+                        st.markdown("**Job Description:**")
+                        st.text(job['description'])
+            else:
+                st.warning("No matching jobs found. Try expanding your skills or lowering the match threshold.")
+        
+        except Exception as e:
+            st.error(f"Job discovery error: {e}")
+    
+    else:
+         st.error("Analysis Failed. Check the backend logs/API key.")
+
 # --- STREAMLIT UI LAYOUT AND DISPLAY LOGIC ---
 
 st.set_page_config(layout="wide", page_title="AI Career Platform Prototype")
@@ -34,20 +228,30 @@ st.markdown("---")
 # --- SIDEBAR: JOB SCRAPING CONTROL ---
 with st.sidebar:
     st.subheader("📊 Job Database Control")
-    jobs_count = count_jobs()
+    jobs_count = _cached_count_jobs()
     st.metric(label="Cached Jobs", value=jobs_count)
     
     if st.button("🔍 Scrape Jobs from Internet", help="Scrapes Indeed, GitHub Jobs, and other sources"):
         with st.spinner("Scraping job listings... (this may take 30-60 seconds)"):
             try:
-                new_jobs = scrape_all_sources(keywords="python developer", max_jobs=50)
+                new_jobs = scrape_all_sources(
+                    keywords="python developer",
+                    max_jobs=50,
+                    progress_callback=lambda source, n: st.toast(f"{source}: {n} jobs scraped"),
+                )
                 st.success(f"✅ Scraped {len(new_jobs)} new jobs!")
+                _cached_count_jobs.clear()
+                _cached_discover_jobs.clear()
+                clear_progress_cache()
             except Exception as e:
                 st.error(f"Scraping error: {e}. Using cached jobs instead.")
     
     if st.button("🗑️ Clear Job Cache", help="Deletes all cached jobs"):
         from job_database import clear_jobs
         clear_jobs()
+        _cached_count_jobs.clear()
+        _cached_discover_jobs.clear()
+        clear_progress_cache()
         st.success("Cache cleared!")
     if st.button("📈 Open Dashboard", help="Open user dashboard and analytics"):
         # render the dashboard in the main app area
@@ -62,7 +266,11 @@ job_description = ""
 # File Upload Section
 # File Upload Section
 st.header("1. Intelligent Resume Analysis")
-uploaded_file = st.file_uploader("Choose a PDF file to analyze:", type="pdf")
+uploaded_files = st.file_uploader("Choose one or more PDF files to analyze:", type="pdf", accept_multiple_files=True)
+bulk_mode = st.checkbox(
+    "Bulk mode (Gemini Batch API)",
+    help="For large uploads: about half the cost per resume, but results can take several minutes.",
+) if uploaded_files and len(uploaded_files) > 1 else False
 
 
 # User Input for Job Discovery/Interview Prep (Input field for backend use)
@@ -81,128 +289,36 @@ if st.button(
         with st.spinner('Running multi-step AI analysis and data structuring...'):
             
             # 1. Get Raw Text (Calls the function defined above in app.py)
-            raw_text = get_raw_text_from_pdf(uploaded_file)
-            if not raw_text:
+            raw_texts = get_raw_texts_from_pdfs(uploaded_files) if uploaded_files else []
+            if not raw_texts or not all(raw_texts):
                 st.error("Cannot proceed. Raw text extraction failed.")
                 st.stop()
                 
             # 2. Run Core Analysis (Calls function in analysis.py)
-            analysis_data = run_analysis(raw_text, job_description)
-            
-            # --- DISPLAY RESULTS (MEMBER 1'S CORE TASK) ---
-            st.markdown("---")
-            
-            if analysis_data is not BLANK_ANALYSIS_DATA:
-                st.success("✅ Analysis Complete! Structured Profile & Insights:")
+            # Several resumes are analyzed with concurrent Gemini calls instead of N sequential ones,
+            # or as one discounted Batch Mode job when bulk mode is on
+            if bulk_mode:
+                analyses = run_analysis_batch([(raw_text, job_description) for raw_text in raw_texts])
+            elif len(raw_texts) > 1:
+                analyses = run_analysis_concurrent([(raw_text, job_description) for raw_text in raw_texts])
+            else:
+                analyses = [run_analysis(raw_texts[0], job_description)]
 
-                # Display General Profile
-                st.subheader("2.1 Candidate Core Profile")
-                col1, col2 = st.columns([1, 2])
-                
-                with col1:
-                    st.metric(label="Name", value=analysis_data['core_profile']['name'])
-                    st.metric(label="Email", value=analysis_data['core_profile']['email'])
-                    st.metric(label="Phone", value=analysis_data['core_profile']['phone'])
-                
-                with col2:
-                    st.markdown(f"**Summary:**")
-                    st.info(analysis_data['core_profile']['summary'])
-                
-                st.markdown("#### Education History")
-                if analysis_data['core_profile']['education']:
-                    education_df = pd.DataFrame(analysis_data['core_profile']['education'])
-                    st.dataframe(education_df, hide_index=True)
-                
-                st.markdown("---")
+            # Keep results across reruns so unrelated widget changes don't drop (or redo) the analysis
+            st.session_state['analyses'] = [(f.name, data) for f, data in zip(uploaded_files, analyses)]
+            st.session_state['last_resume_skills'] = [
+                skill['skill'] for _, data in st.session_state['analyses'] for skill in data.get('technical_expertise', [])
+            ] or None
 
-                # Display Technical Expertise
-                st.subheader("2.2 Technical Expertise & Proficiency Levels")
-                
-                if analysis_data['technical_expertise']:
-                    expertise_df = pd.DataFrame(analysis_data['technical_expertise'])
-                    expertise_df['keywords'] = expertise_df['keywords'].apply(lambda x: ", ".join(x))
-                    expertise_df.rename(columns={'skill': 'Skill Area', 'proficiency': 'Proficiency Level', 'keywords': 'Related Tools/Keywords'}, inplace=True)
-                    st.table(expertise_df)
-                else:
-                    st.warning("No technical expertise identified.")
-                
-                st.markdown("---")
-                
-                # Display Job Match Analysis
-                st.subheader("3. Automated Job Discovery & Matching (MVP)")
-                st.markdown("*(Match against the job description provided above)*")
-                
-                match_score = analysis_data['job_match_analysis']['match_score']
-                st.metric(label="Match Score", value=f"{match_score}%", help="Compatibility Score explaining why the job fits.")
-                
-                st.markdown("#### Compatibility Explanation (Justification)")
-                st.code(analysis_data['job_match_analysis']['justification'], language=None)
-                
-                st.markdown("---")
-
-                # Placeholder for Interview Prep
-                st.subheader("4. Deep Research-Powered Interview Preparation")
-                st.warning("Interview Preparation materials (e.g., questions, study guide) will appear here.")
-                
-                st.markdown("---")
-                
-                # --- JOB DISCOVERY & MATCHING ---
-                st.subheader("5. Automated Job Discovery & Matching")
-                st.markdown("Discovering job opportunities based on your skills...")
-                
-                try:
-                    # Extract skills from analysis for job matching
-                    resume_skills = [skill['skill'] for skill in analysis_data.get('technical_expertise', [])]
-                    
-                    # Estimate experience years from experience field (simple heuristic)
-                    experience_years = 3  # default
-                    try:
-                        experience_field = analysis_data.get('core_profile', {}).get('summary', '')
-                        years_match = __import__('re').search(r'(\d+)\s*(?:\+)?\s*years?', experience_field, __import__('re').IGNORECASE)
-                        if years_match:
-                            experience_years = int(years_match.group(1))
-                    except:
-                        pass
-                    
-                    # Discover jobs
-                    job_results = discover_jobs_for_resume(resume_skills, experience_years, min_score_threshold=25.0)
-                    
-                    st.metric(label="Total Jobs Found", value=job_results['total_jobs_found'])
-                    st.metric(label="Matched Jobs", value=job_results['jobs_matched'])
-                    
-                    if job_results['ranked_jobs']:
-                        st.markdown("#### Top Job Matches:")
-                        
-                        for idx, job in enumerate(job_results['ranked_jobs'][:10], 1):
-                            with st.expander(f"#{idx} {job['title']} at {job['company']} ({job['compatibility_score']}% match)"):
-                                col1, col2 = st.columns([1, 1])
-                                
-                                with col1:
-                                    st.markdown(f"**Location:** {job['location']}")
-                                    st.markdown(f"**Salary:** {job['salary']}")
-                                    st.markdown(f"**Level:** {job['experience_level']}")
-                                
-                                with col2:
-                                    st.markdown(f"**Compatibility Score:** {job['compatibility_score']}%")
-                                    st.markdown(f"**Matched Skills:** {', '.join(job['compatibility_details']['matched_skills']) if job['compatibility_details']['matched_skills'] else 'None'}")
-                                    if job['compatibility_details']['missing_skills']:
-                                        st.markdown(f"**Missing Skills:** {', '.join(job['compatibility_details']['missing_skills'])}")
-                                
-                                st.markdown("**Why This Match:**")
-                                st.info(job['justification'])
-                                
-                                st.markdown("**Job Description:**")
-                                st.text(job['description'])
-                    else:
-                        st.warning("No matching jobs found. Try expanding your skills or lowering the match threshold.")
-                
-                except Exception as e:
-                    st.error(f"Job discovery error: {e}")
-            
-            else:
-                 st.error("Analysis Failed. Check the backend logs/API key.")
+# Render the latest analysis results from memory
+if st.session_state.get('analyses'):
+    analyses = st.session_state['analyses']
+    result_tabs = st.tabs([name for name, _ in analyses]) if len(analyses) > 1 else [st.container()]
+    for result_tab, (_, analysis_data) in zip(result_tabs, analyses):
+        with result_tab:
+            render_analysis_results(analysis_data)
 
 # Footer/Initial Instruction
 st.markdown("---")
-if uploaded_file is None:
+if not uploaded_files:
     st.warning("Upload a PDF resume above to start the user journey.")
\ No newline at end of file
@@ -1,79 +1,86 @@
 import sqlite3
 import json
+import functools
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import os
+from db_pool import get_pool
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "jobs.db")
+_pool = get_pool(DB_PATH)
+# Set once the analytics table exists, so its DDL runs once per process rather than per call
+_ANALYTICS_READY = False
 
 
 def init_analytics_table():
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS interview_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT,
-            questions TEXT,
-            notes TEXT,
-            completed INTEGER DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    global _ANALYTICS_READY
+    if _ANALYTICS_READY:
+        return
+    with _pool.acquire() as conn:
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS interview_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT,
+                questions TEXT,
+                notes TEXT,
+                completed INTEGER DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_interview_created_at ON interview_history(created_at)')
+    _ANALYTICS_READY = True
 
 
 def record_interview_session(title: str, questions: List[str], notes: str = "", completed: bool = False) -> int:
     init_analytics_table()
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute('INSERT INTO interview_history (title, questions, notes, completed) VALUES (?, ?, ?, ?)',
-              (title, json.dumps(questions), notes, 1 if completed else 0))
-    conn.commit()
-    rowid = c.lastrowid
-    conn.close()
+    with _pool.acquire() as conn:
+        c = conn.execute('INSERT INTO interview_history (title, questions, notes, completed) VALUES (?, ?, ?, ?)',
+                         (title, json.dumps(questions), notes, 1 if completed else 0))
+        rowid = c.lastrowid
     return rowid
 
 
 def get_interview_history(limit: int = 50) -> List[Dict[str, Any]]:
     init_analytics_table()
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    c.execute('SELECT * FROM interview_history ORDER BY created_at DESC LIMIT ?', (limit,))
-    rows = c.fetchall()
     sessions = []
-    for r in rows:
-        sessions.append({
-            'id': r['id'],
-            'title': r['title'],
-            'questions': json.loads(r['questions']) if r['questions'] else [],
-            'notes': r['notes'],
-            'completed': bool(r['completed']),
-            'created_at': r['created_at']
-        })
-    conn.close()
+    with _pool.acquire() as conn:
+        conn.row_factory = sqlite3.Row
+        # Build sessions straight off the cursor instead of materializing every Row first
+        for r in conn.execute('SELECT * FROM interview_history ORDER BY created_at DESC LIMIT ?', (limit,)):
+            sessions.append({
+                'id': r['id'],
+                'title': r['title'],
+                'questions': json.loads(r['questions']) if r['questions'] else [],
+                'notes': r['notes'],
+                'completed': bool(r['completed']),
+                'created_at': r['created_at']
+            })
     return sessions
 
 
 def job_search_progress() -> Dict[str, Any]:
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute('SELECT COUNT(*) FROM jobs')
-    total = c.fetchone()[0]
-
-    # jobs in last 7 days
-    seven_days_ago = datetime.utcnow() - timedelta(days=7)
-    c.execute('SELECT COUNT(*) FROM jobs WHERE scraped_at >= ?', (seven_days_ago,))
-    recent = c.fetchone()[0]
-
-    # breakdown by source
-    c.execute('SELECT source, COUNT(*) as cnt FROM jobs GROUP BY source')
-    rows = c.fetchall()
+    # Served from a per-minute cache; clear_progress_cache() forces a refresh after scrapes/deletes
+    progress = _job_search_progress(int(time.time() // 60))
+    return {**progress, 'by_source': dict(progress['by_source'])}
+
+
+def clear_progress_cache() -> None:
+    _job_search_progress.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _job_search_progress(minute_bucket: int) -> Dict[str, Any]:
+    with _pool.acquire() as conn:
+        # breakdown by source, from the trigger-maintained job_stats counters (see job_database)
+        rows = conn.execute("SELECT NULLIF(source, ''), cnt FROM job_stats").fetchall()
+
+        # jobs in last 7 days
+        seven_days_ago = datetime.utcnow() - timedelta(days=7)
+        recent = conn.execute('SELECT COUNT(*) FROM jobs WHERE scraped_at >= ?', (seven_days_ago,)).fetchone()[0]
     sources = {r[0]: r[1] for r in rows}
+    total = sum(sources.values())
 
-    conn.close()
     return {'total_jobs': total, 'jobs_last_7_days': recent, 'by_source': sources}
 
 
@@ -82,40 +89,42 @@ def skill_coverage_analysis(resume_skills: List[str], sample_limit: int = 500) -
 
     Returns overall coverage percentage, top missing skills, and a histogram of coverage.
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    c = conn.cursor()
-    c.execute('SELECT required_skills FROM jobs LIMIT ?', (sample_limit,))
-    rows = c.fetchall()
-
-    resume_norm = {s.lower() for s in resume_skills}
-    total_jobs = 0
-    match_counts = []
-    missing_counter = {}
-
-    for r in rows:
-        total_jobs += 1
-        skills = []
-        try:
-            skills = json.loads(r['required_skills']) if r['required_skills'] else []
-        except Exception:
-            skills = []
-
-        skills_norm = {s.lower() for s in skills}
-        matched = resume_norm & skills_norm
-        match_counts.append(len(matched) / (len(skills_norm) if skills_norm else 1))
-
-        for sk in skills_norm:
-            if sk not in resume_norm:
-                missing_counter[sk] = missing_counter.get(sk, 0) + 1
-
-    conn.close()
-
-    avg_coverage = (sum(match_counts) / len(match_counts) * 100) if match_counts else 0.0
-    # top missing skills
-    top_missing = sorted(missing_counter.items(), key=lambda x: x[1], reverse=True)[:20]
-
-    return {'avg_coverage_pct': round(avg_coverage, 1), 'top_missing': top_missing, 'total_sampled_jobs': total_jobs}
+    # Matching and counting run in SQLite over the normalized job_skills/skills tables (NOCASE names)
+    resume_names = list(dict.fromkeys(n for n in (s.strip() for s in resume_skills) if n))
+    placeholders = ", ".join("?" * len(resume_names))
+    sample = 'WITH sample AS (SELECT id FROM jobs LIMIT ?)'
+
+    with _pool.acquire() as conn:
+        # Per-job share of required skills the resume covers; jobs without skills count as 0%
+        total_jobs, avg_coverage = conn.execute(f'''
+            {sample}
+            SELECT COUNT(*), AVG(coverage) FROM (
+                SELECT CASE WHEN COUNT(s.id) > 0
+                            THEN SUM(s.name IN ({placeholders})) * 1.0 / COUNT(s.id)
+                            ELSE 0 END AS coverage
+                FROM sample sm
+                LEFT JOIN job_skills js ON js.job_id = sm.id
+                LEFT JOIN skills s ON s.id = js.skill_id
+                GROUP BY sm.id
+            )
+        ''', (sample_limit, *resume_names)).fetchone()
+
+        # top missing skills; with ORDER BY + LIMIT SQLite's sorter only keeps the best 20 groups in memory
+        top_missing = conn.execute(f'''
+            {sample}
+            SELECT lower(s.name), COUNT(*) AS occurrences
+            FROM sample sm
+            JOIN job_skills js ON js.job_id = sm.id
+            JOIN skills s ON s.id = js.skill_id
+            WHERE s.name NOT IN ({placeholders})
+            GROUP BY s.id
+            ORDER BY occurrences DESC, s.id
+            LIMIT 20
+        ''', (sample_limit, *resume_names)).fetchall()
+
+    avg_coverage = (avg_coverage or 0.0) * 100
+
+    return {'avg_coverage_pct': round(avg_coverage, 1), 'top_missing': [tuple(r) for r in top_missing], 'total_sampled_jobs': total_jobs}
 
 
 def render_dashboard(resume_skills: Optional[List[str]] = None):
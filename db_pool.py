@@ -0,0 +1,85 @@
+"""
+SQLite Connection Pool
+
+Keeps a small set of pre-opened connections to the jobs database so each
+query reuses a warm connection (parsed schema, page cache) instead of
+connecting and closing on every call.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+DB_PATH = os.path.join(os.path.dirname(__file__), "jobs.db")
+# Number of connections opened per database file
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+# Bytes of the DB file each connection may memory-map for reads (256 MiB); 0 disables mmap,
+# e.g. where it is clamped or unreliable (some Windows / network filesystems)
+DB_MMAP_SIZE = int(os.getenv("DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+# Page cache per connection in KiB (64 MiB); passed to cache_size as a negative value
+DB_CACHE_KIB = int(os.getenv("DB_CACHE_KIB", "65536"))
+
+
+class SQLiteConnectionPool:
+    """Fixed-size pool of autocommit SQLite connections shared across threads."""
+
+    def __init__(self, db_path: str = DB_PATH, size: int = DB_POOL_SIZE):
+        self.db_path = db_path
+        self.size = max(1, size)
+        self._pool = queue.Queue(maxsize=self.size)
+        for _ in range(self.size):
+            self._pool.put(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        # check_same_thread=False: a connection may be handed to a different thread on each checkout
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        # WAL lets dashboard reads proceed while a scrape is writing
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA mmap_size={DB_MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size=-{DB_CACHE_KIB}")
+        return conn
+
+    def get(self, timeout: float = None) -> sqlite3.Connection:
+        """Check out a connection, blocking until one is free."""
+        return self._pool.get(timeout=timeout)
+
+    def put(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool, discarding per-caller state."""
+        conn.row_factory = None
+        if conn.in_transaction:
+            conn.rollback()
+        self._pool.put(conn)
+
+    @contextmanager
+    def acquire(self):
+        """`with pool.acquire() as conn:` checks a connection out and always returns it."""
+        conn = self.get()
+        try:
+            yield conn
+        finally:
+            self.put(conn)
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(db_path: str = DB_PATH) -> SQLiteConnectionPool:
+    """Process-wide pool for `db_path`, created on first use."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(db_path)
+        if pool is None:
+            pool = _POOLS[db_path] = SQLiteConnectionPool(db_path)
+        return pool
@@ -5,41 +5,155 @@ Handles persistence of scraped job listings using SQLite.
 Provides methods to save, retrieve, and query jobs.
 """
 
-import sqlite3
 import json
+import functools
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import os
+from db_pool import get_pool
+
+# orjson decodes the required_skills column faster; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
 
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "jobs.db")
+# Shared warm connections (see db_pool.py) instead of connect/close per call
+_pool = get_pool(DB_PATH)
+
+# Skills of the row being written, one json_each row per skill (malformed JSON counts as no skills)
+_SKILL_VALUES_SQL = "json_each(CASE WHEN json_valid({col}) THEN {col} ELSE '[]' END)"
+
+
+def _link_skills_sql(job_id: str, skills_col: str, tables: str = "") -> str:
+    """Statements adding the skills in `skills_col` to `skills` and linking them to `job_id` in job_skills."""
+    values = tables + _SKILL_VALUES_SQL.format(col=skills_col)
+    return f'''
+        INSERT OR IGNORE INTO skills(name)
+            SELECT trim(je.value) FROM {values} AS je WHERE trim(je.value) <> '';
+        INSERT OR IGNORE INTO job_skills(job_id, skill_id)
+            SELECT {job_id}, s.id FROM {values} AS je JOIN skills s ON s.name = trim(je.value);
+    '''
+
+
+def _init_job_stats(conn):
+    """Per-source job counters kept current by triggers, so dashboard counts are lookups instead of scans."""
+    exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'job_stats'").fetchone()
+    # NULL sources are stored as '' because NULLs never conflict on a TEXT primary key
+    conn.execute('CREATE TABLE IF NOT EXISTS job_stats (source TEXT PRIMARY KEY, cnt INTEGER NOT NULL)')
+    bump = '''
+        INSERT INTO job_stats(source, cnt) VALUES (IFNULL(new.source, ''), 1)
+            ON CONFLICT(source) DO UPDATE SET cnt = cnt + 1;
+    '''
+    drop = '''
+        UPDATE job_stats SET cnt = cnt - 1 WHERE source = IFNULL(old.source, '');
+        DELETE FROM job_stats WHERE source = IFNULL(old.source, '') AND cnt <= 0;
+    '''
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS jobs_stats_ai AFTER INSERT ON jobs BEGIN {bump} END")
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS jobs_stats_ad AFTER DELETE ON jobs BEGIN {drop} END")
+    conn.execute(f"CREATE TRIGGER IF NOT EXISTS jobs_stats_au AFTER UPDATE OF source ON jobs BEGIN {drop} {bump} END")
+    if not exists:
+        conn.execute("INSERT INTO job_stats(source, cnt) SELECT IFNULL(source, ''), COUNT(*) FROM jobs GROUP BY 1")
+
+
+def _init_skill_tables(conn):
+    """Create the normalized skills / job_skills tables and the triggers that fill them from jobs.required_skills."""
+    exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'job_skills'").fetchone()
+    conn.execute('CREATE TABLE IF NOT EXISTS skills (id INTEGER PRIMARY KEY, name TEXT UNIQUE COLLATE NOCASE)')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS job_skills (
+            job_id INTEGER NOT NULL,
+            skill_id INTEGER NOT NULL,
+            PRIMARY KEY (job_id, skill_id)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills(skill_id)')
+
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS jobs_skills_ai AFTER INSERT ON jobs BEGIN
+            {_link_skills_sql("new.id", "new.required_skills")}
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS jobs_skills_ad AFTER DELETE ON jobs BEGIN
+            DELETE FROM job_skills WHERE job_id = old.id;
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS jobs_skills_au AFTER UPDATE OF required_skills ON jobs BEGIN
+            DELETE FROM job_skills WHERE job_id = old.id;
+            {_link_skills_sql("new.id", "new.required_skills")}
+        END
+    ''')
+    if not exists:
+        # Link rows saved before the tables existed
+        conn.executescript(f"BEGIN; {_link_skills_sql('j.id', 'j.required_skills', tables='jobs AS j, ')} COMMIT;")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_skills(raw: str) -> tuple:
+    return tuple(orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw))
+
+
+def decode_skills(raw: Optional[str]) -> List[str]:
+    """required_skills column -> list. Listings often share the same skill JSON, so each distinct string is parsed once."""
+    return list(_parse_skills(raw)) if raw else []
 
 
 def init_database():
     """Initialize SQLite database with jobs table."""
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS jobs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_id TEXT UNIQUE,
-            title TEXT NOT NULL,
-            company TEXT NOT NULL,
-            location TEXT,
-            description TEXT,
-            required_skills TEXT,
-            experience_level TEXT,
-            salary TEXT,
-            source TEXT,
-            job_url TEXT,
-            scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(job_id)
-        )
-    ''')
-    
-    conn.commit()
-    conn.close()
+    with _pool.acquire() as conn:
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id TEXT UNIQUE,
+                title TEXT NOT NULL,
+                company TEXT NOT NULL,
+                location TEXT,
+                description TEXT,
+                required_skills TEXT,
+                experience_level TEXT,
+                salary TEXT,
+                source TEXT,
+                job_url TEXT,
+                scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(job_id)
+            )
+        ''')
+        # Dashboard filters/groups on these (get_jobs_by_source, job_search_progress)
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs(scraped_at)')
+        _init_skill_tables(conn)
+        _init_job_stats(conn)
+
+
+# Single SQL string shared by every insert so sqlite3 reuses its prepared statement
+_INSERT_JOB_SQL = '''
+    INSERT OR IGNORE INTO jobs 
+    (job_id, title, company, location, description, required_skills, 
+     experience_level, salary, source, job_url)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def _job_row(job: Dict[str, Any]) -> tuple:
+    """Parameter tuple for _INSERT_JOB_SQL."""
+    return (
+        job.get('id', f"{job.get('company')}_{job.get('title')}_{datetime.now().timestamp()}"),
+        job.get('title'),
+        job.get('company'),
+        job.get('location'),
+        job.get('description'),
+        # Convert list fields to JSON
+        json.dumps(job.get('required_skills', [])),
+        job.get('experience_level', 'Not specified'),
+        job.get('salary'),
+        job.get('source', 'Unknown'),
+        job.get('job_url')
+    )
 
 
 def save_job(job: Dict[str, Any]) -> bool:
@@ -48,32 +162,9 @@ def save_job(job: Dict[str, Any]) -> bool:
     Returns True if successful, False if job already exists.
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        
-        # Convert list fields to JSON
-        required_skills = json.dumps(job.get('required_skills', []))
-        
-        c.execute('''
-            INSERT OR IGNORE INTO jobs 
-            (job_id, title, company, location, description, required_skills, 
-             experience_level, salary, source, job_url)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            job.get('id', f"{job.get('company')}_{job.get('title')}_{datetime.now().timestamp()}"),
-            job.get('title'),
-            job.get('company'),
-            job.get('location'),
-            job.get('description'),
-            required_skills,
-            job.get('experience_level', 'Not specified'),
-            job.get('salary'),
-            job.get('source', 'Unknown'),
-            job.get('job_url')
-        ))
-        
-        conn.commit()
-        conn.close()
+        row = _job_row(job)
+        with _pool.acquire() as conn:
+            conn.execute(_INSERT_JOB_SQL, row)
         return True
     except Exception as e:
         print(f"Error saving job: {e}")
@@ -81,33 +172,57 @@ def save_job(job: Dict[str, Any]) -> bool:
 
 
 def save_jobs_batch(jobs: List[Dict[str, Any]]) -> int:
-    """Save multiple jobs to database. Returns count of successfully saved jobs."""
-    count = 0
-    for job in jobs:
-        if save_job(job):
-            count += 1
-    return count
+    """
+    Save multiple jobs in one transaction with a single executemany.
+    Returns the number of new rows inserted (duplicates are ignored).
+    """
+    if not jobs:
+        return 0
+    try:
+        rows = [_job_row(job) for job in jobs]
+        with _pool.acquire() as conn:
+            # Take the write lock up front so a concurrent writer makes us wait here (busy timeout), not mid-batch
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                inserted = conn.executemany(_INSERT_JOB_SQL, rows).rowcount
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    except Exception as e:
+        # Keep the good rows when one job can't be serialized/bound
+        print(f"Error saving job batch, falling back to per-job inserts: {e}")
+        return sum(1 for job in jobs if save_job(job))
+
+    if inserted > 0:
+        # Refresh planner statistics so the source/scraped_at indexes get used; the rows are already committed
+        try:
+            with _pool.acquire() as conn:
+                conn.execute('ANALYZE jobs')
+        except Exception as e:
+            print(f"Error refreshing job statistics: {e}")
+    return inserted
+
+
+def _read_jobs(sql: str, params: tuple) -> List[Dict[str, Any]]:
+    """Run a `SELECT * FROM jobs ...` query, building job dicts straight off the cursor (no fetchall() list of Rows)."""
+    jobs = []
+    with _pool.acquire() as conn:
+        # Plain tuples zipped with column names read once per query: one dict per row, no sqlite3.Row + dict(row) copy
+        cur = conn.execute(sql, params)
+        columns = [d[0] for d in cur.description]
+        for row in cur:
+            job = dict(zip(columns, row))
+            # Convert JSON back to list
+            job['required_skills'] = decode_skills(job['required_skills'])
+            jobs.append(job)
+    return jobs
 
 
 def get_all_jobs(limit: int = 100) -> List[Dict[str, Any]]:
     """Retrieve all jobs from database."""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        c = conn.cursor()
-        
-        c.execute('SELECT * FROM jobs LIMIT ?', (limit,))
-        rows = c.fetchall()
-        
-        jobs = []
-        for row in rows:
-            job = dict(row)
-            # Convert JSON back to list
-            job['required_skills'] = json.loads(job['required_skills']) if job['required_skills'] else []
-            jobs.append(job)
-        
-        conn.close()
-        return jobs
+        return _read_jobs('SELECT * FROM jobs LIMIT ?', (limit,))
     except Exception as e:
         print(f"Error retrieving jobs: {e}")
         return []
@@ -116,29 +231,20 @@ def get_all_jobs(limit: int = 100) -> List[Dict[str, Any]]:
 def search_jobs_by_skills(skills: List[str], limit: int = 50) -> List[Dict[str, Any]]:
     """Search for jobs that match any of the provided skills."""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        c = conn.cursor()
-        
-        # Get all jobs and filter in Python (SQLite JSON support varies)
-        c.execute('SELECT * FROM jobs LIMIT ?', (limit * 3,))  # Get extra to filter
-        rows = c.fetchall()
+        names = list(dict.fromkeys(n for n in (s.strip() for s in skills) if n))
+        if not names:
+            return []
         
-        matched_jobs = []
-        skills_normalized = {s.lower() for s in skills}
-        
-        for row in rows:
-            job = dict(row)
-            job['required_skills'] = json.loads(job['required_skills']) if job['required_skills'] else []
-            
-            job_skills_normalized = {s.lower() for s in job['required_skills']}
-            
-            # Check for skill overlap
-            if job_skills_normalized & skills_normalized:
-                matched_jobs.append(job)
-        
-        conn.close()
-        return matched_jobs[:limit]
+        # Case-insensitive (NOCASE) skill lookup through job_skills; only matching rows are read and decoded
+        placeholders = ", ".join("?" * len(names))
+        return _read_jobs(f'''
+            SELECT * FROM jobs
+            WHERE id IN (
+                SELECT js.job_id FROM job_skills js JOIN skills s ON s.id = js.skill_id
+                WHERE s.name IN ({placeholders})
+            )
+            ORDER BY id LIMIT ?
+        ''', (*names, limit))
     except Exception as e:
         print(f"Error searching jobs: {e}")
         return []
@@ -147,21 +253,7 @@ def search_jobs_by_skills(skills: List[str], limit: int = 50) -> List[Dict[str,
 def get_jobs_by_source(source: str, limit: int = 50) -> List[Dict[str, Any]]:
     """Retrieve jobs from a specific source."""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        c = conn.cursor()
-        
-        c.execute('SELECT * FROM jobs WHERE source = ? LIMIT ?', (source, limit))
-        rows = c.fetchall()
-        
-        jobs = []
-        for row in rows:
-            job = dict(row)
-            job['required_skills'] = json.loads(job['required_skills']) if job['required_skills'] else []
-            jobs.append(job)
-        
-        conn.close()
-        return jobs
+        return _read_jobs('SELECT * FROM jobs WHERE source = ? LIMIT ?', (source, limit))
     except Exception as e:
         print(f"Error retrieving jobs by source: {e}")
         return []
@@ -170,13 +262,10 @@ def get_jobs_by_source(source: str, limit: int = 50) -> List[Dict[str, Any]]:
 def count_jobs() -> int:
     """Get total count of jobs in database."""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
+        with _pool.acquire() as conn:
+            # Trigger-maintained counters (see _init_job_stats) instead of a table scan
+            count = conn.execute('SELECT IFNULL(SUM(cnt), 0) FROM job_stats').fetchone()[0]
         
-        c.execute('SELECT COUNT(*) FROM jobs')
-        count = c.fetchone()[0]
-        
-        conn.close()
         return count
     except Exception as e:
         print(f"Error counting jobs: {e}")
@@ -186,16 +275,11 @@ def count_jobs() -> int:
 def clear_jobs(source: Optional[str] = None):
     """Clear all jobs or jobs from a specific source."""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        c = conn.cursor()
-        
-        if source:
-            c.execute('DELETE FROM jobs WHERE source = ?', (source,))
-        else:
-            c.execute('DELETE FROM jobs')
-        
-        conn.commit()
-        conn.close()
+        with _pool.acquire() as conn:
+            if source:
+                conn.execute('DELETE FROM jobs WHERE source = ?', (source,))
+            else:
+                conn.execute('DELETE FROM jobs')
     except Exception as e:
         print(f"Error clearing jobs: {e}")
 
@@ -5,11 +5,33 @@ Discovers and matches job listings based on resume qualifications,
 ranks by relevance, and computes compatibility scores with explanations.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
+from dataclasses import dataclass
+import functools
+import importlib.util
+import itertools
+import logging
+import os
 import re
-from job_scraper import get_cached_jobs
+import threading
+import time
+import numpy as np
+from job_scraper import get_cached_jobs, scrape_all_sources
 from job_database import search_jobs_by_skills
 
+log = logging.getLogger(__name__)
+
+# Optional JIT for the bitset match-count kernel on large batches; plain numpy is used without it.
+# numba itself is only imported once a batch needs the kernel (see _numba_match_counts).
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Optional compiled scorer (score_batch.pyx, built with `cythonize -i score_batch.pyx`); preferred over numba
+try:
+    from score_batch import score_batch
+    SCORE_BATCH_AVAILABLE = True
+except Exception:
+    SCORE_BATCH_AVAILABLE = False
+
 
 # --- FALLBACK MOCK JOB DATA (if scraping fails) ---
 FALLBACK_MOCK_JOBS = [
@@ -71,25 +93,235 @@ FALLBACK_MOCK_JOBS = [
 ]
 
 
+# Job level -> expected (min, max) years of experience
+LEVEL_TO_YEARS = {
+    "junior": (0, 2),
+    "mid-level": (2, 5),
+    "senior": (5, 20),
+    "lead": (7, 20),
+}
+
+
 def normalize_skill(skill: str) -> str:
     """Normalize skill name for matching (lowercase, strip whitespace)."""
     return skill.lower().strip()
 
 
+# ---------------------- BITSET SCORING ----------------------
+
+# Normalized skill -> bit position in the job/resume bitsets (and the reverse, for decoding masks)
+_skill_ids: Dict[str, int] = {}
+_skill_names: List[str] = []
+_skill_ids_lock = threading.Lock()
+
+
+def _intern(skill: str) -> int:
+    key = skill.lower().strip()
+    sid = _skill_ids.get(key)
+    if sid is None:
+        with _skill_ids_lock:
+            sid = _skill_ids.get(key)
+            if sid is None:
+                sid = len(_skill_names)
+                _skill_names.append(key)
+                _skill_ids[key] = sid
+    return sid
+
+
+@functools.lru_cache(maxsize=4096)
+def _skill_mask(skill_key: tuple) -> int:
+    """Skill key as a Python-int bitset (bit i = interned skill i)."""
+    mask = 0
+    for skill in skill_key:
+        mask |= 1 << _intern(skill)
+    return mask
+
+
+def _decode_mask(mask: int) -> frozenset:
+    names = []
+    while mask:
+        low = mask & -mask
+        names.append(_skill_names[low.bit_length() - 1])
+        mask ^= low
+    return frozenset(names)
+
+
+@functools.lru_cache(maxsize=4096)
+def _skill_id_tuple(skills: tuple) -> tuple:
+    """Distinct interned ids of a skill list, computed once per distinct list."""
+    return tuple(dict.fromkeys(_intern(s) for s in skills))
+
+
+def _pack_bitsets(id_lists: List[tuple], lanes: int) -> np.ndarray:
+    """(len(id_lists), lanes) uint64 array with bit `id` set in row i for every id in id_lists[i]."""
+    bits = np.zeros((len(id_lists), lanes), dtype=np.uint64)
+    counts = np.fromiter((len(ids) for ids in id_lists), dtype=np.int64, count=len(id_lists))
+    total = int(counts.sum())
+    if total:
+        rows = np.repeat(np.arange(len(id_lists)), counts)
+        ids = np.fromiter(itertools.chain.from_iterable(id_lists), dtype=np.int64, count=total)
+        np.bitwise_or.at(bits, (rows, ids >> 6), np.left_shift(np.uint64(1), (ids & 63).astype(np.uint64)))
+    return bits
+
+
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+_H01 = np.uint64(0x0101010101010101)
+
+
+def _popcount64(x):
+    """SWAR popcount; works on uint64 scalars and arrays (and under numba)."""
+    x = x - ((x >> np.uint64(1)) & _M1)
+    x = (x & _M2) + ((x >> np.uint64(2)) & _M2)
+    x = (x + (x >> np.uint64(4))) & _M4
+    return (x * _H01) >> np.uint64(56)
+
+
+def _match_counts_numpy(resume_mask: np.ndarray, jobs_bitset: np.ndarray) -> np.ndarray:
+    return _popcount64(jobs_bitset & resume_mask).sum(axis=1).astype(np.int64)
+
+
+# Below this many job rows the numpy path is as fast as the kernel, so small batches never trigger its compile
+NUMBA_MIN_JOBS = 20000
+
+_popcount64_jit = None
+
+
+@functools.lru_cache(maxsize=1)
+def _numba_match_counts():
+    """Parallel numba match-count kernel, built on first use; None when numba fails to import."""
+    global _popcount64_jit
+    try:
+        from numba import njit, prange
+    except Exception:
+        return None
+    # cache=True keeps the compiled kernels on disk (__pycache__), so only the first process ever compiles them
+    _popcount64_jit = njit(cache=True)(_popcount64)
+
+    @njit(parallel=True, cache=True)
+    def match_counts(resume_mask, jobs_bitset):
+        n, lanes = jobs_bitset.shape
+        out = np.zeros(n, dtype=np.int64)
+        for i in prange(n):
+            c = 0
+            for w in range(lanes):
+                c += np.int64(_popcount64_jit(jobs_bitset[i, w] & resume_mask[w]))
+            out[i] = c
+        return out
+
+    return match_counts
+
+
+def _match_counts(resume_mask: np.ndarray, jobs_bitset: np.ndarray) -> np.ndarray:
+    if NUMBA_AVAILABLE and jobs_bitset.shape[0] >= NUMBA_MIN_JOBS:
+        kernel = _numba_match_counts()
+        if kernel is not None:
+            return kernel(resume_mask, jobs_bitset)
+    return _match_counts_numpy(resume_mask, jobs_bitset)
+
+
+def score_all(
+    resume_mask: np.ndarray,
+    jobs_bitset: np.ndarray,
+    unique_counts: np.ndarray,
+    required_counts: np.ndarray,
+    years: float,
+    exp_min: np.ndarray,
+    exp_max: np.ndarray,
+) -> np.ndarray:
+    """Unrounded compute_compatibility_score totals for every job row at once."""
+    if SCORE_BATCH_AVAILABLE:
+        return score_batch(jobs_bitset, resume_mask, unique_counts, required_counts, years, exp_min, exp_max)
+    matched = _match_counts(resume_mask, jobs_bitset).astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        overlap_pct = np.where(unique_counts > 0, matched / unique_counts * 100, 0.0)
+        coverage = np.where(required_counts > 0, matched / required_counts * 100, 0.0)
+        exp = np.where(
+            years >= exp_min,
+            np.minimum(100, years / exp_max * 100),
+            np.maximum(0, years / exp_min * 100),
+        )
+    return overlap_pct * 0.4 + exp * 0.3 + coverage * 0.3
+
+
+@dataclass
+class JobTable:
+    """Column-wise (SoA) view of a job list for vectorized ranking; row i is jobs[i]."""
+    jobs: List[Dict[str, Any]]
+    skill_keys: List[tuple]
+    levels: List[tuple]
+    skills_bitset: np.ndarray
+    unique_counts: np.ndarray
+    required_counts: np.ndarray
+    exp_min: np.ndarray
+    exp_max: np.ndarray
+
+    @classmethod
+    def from_dicts(cls, jobs: List[Dict[str, Any]]) -> "JobTable":
+        """Build the columns once; per-job dict lookups happen here and nowhere else."""
+        jobs = list(jobs)
+        job_ids = [_skill_id_tuple(tuple(job["required_skills"])) for job in jobs]
+        lanes = max(1, (len(_skill_ids) + 63) // 64)
+        levels = [LEVEL_TO_YEARS.get(job["experience_level"].lower(), (0, 20)) for job in jobs]
+        return cls(
+            jobs=jobs,
+            skill_keys=[_skill_key(tuple(job["required_skills"])) for job in jobs],
+            levels=levels,
+            skills_bitset=_pack_bitsets(job_ids, lanes),
+            unique_counts=np.fromiter((len(ids) for ids in job_ids), dtype=np.float64, count=len(jobs)),
+            required_counts=np.fromiter((len(job["required_skills"]) for job in jobs), dtype=np.float64, count=len(jobs)),
+            exp_min=np.array([lo for lo, _ in levels], dtype=np.float64),
+            exp_max=np.array([hi for _, hi in levels], dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def row(self, i: int) -> Dict[str, Any]:
+        return self.jobs[i]
+
+    def scores(self, resume_skills: List[str], experience_years: float) -> np.ndarray:
+        """Unrounded compatibility totals of every row against one resume."""
+        lanes = self.skills_bitset.shape[1]
+        # Skills interned after this table was built can't match any of its rows
+        resume_ids = tuple(i for i in _skill_id_tuple(tuple(resume_skills)) if i < lanes * 64)
+        return score_all(
+            _pack_bitsets([resume_ids], lanes)[0],
+            self.skills_bitset,
+            self.unique_counts,
+            self.required_counts,
+            float(experience_years),
+            self.exp_min,
+            self.exp_max,
+        )
+
+
+@functools.lru_cache(maxsize=4096)
+def _skill_key(skills: tuple) -> tuple:
+    """Normalized, de-duplicated, sorted skills; the hashable cache key for a skill list."""
+    return tuple(sorted({s.lower().strip() for s in skills}))
+
+
+@functools.lru_cache(maxsize=4096)
+def _overlap_cached(resume_key: tuple, job_key: tuple) -> tuple:
+    """(matched, unmatched, overlap_pct) for two _skill_key tuples; jobs often share skill lists."""
+    resume_mask = _skill_mask(resume_key)
+    job_mask = _skill_mask(job_key)
+    
+    # AND + popcount on int bitsets; names are decoded from the masks only for the result
+    matched_mask = resume_mask & job_mask
+    overlap_pct = (matched_mask.bit_count() / len(job_key) * 100) if job_key else 0
+    
+    return _decode_mask(matched_mask), _decode_mask(job_mask & ~resume_mask), overlap_pct
+
+
 def compute_skill_overlap(resume_skills: List[str], job_required_skills: List[str]) -> tuple:
     """
     Compute overlap between resume skills and job requirements.
     Returns (matched_skills, unmatched_required, overlap_percentage).
     """
-    resume_normalized = {normalize_skill(s) for s in resume_skills}
-    job_normalized = {normalize_skill(s) for s in job_required_skills}
-    
-    matched = resume_normalized & job_normalized
-    unmatched = job_normalized - resume_normalized
-    
-    overlap_pct = (len(matched) / len(job_normalized) * 100) if job_normalized else 0
-    
-    return matched, unmatched, overlap_pct
+    return _overlap_cached(_skill_key(tuple(resume_skills)), _skill_key(tuple(job_required_skills)))
 
 
 def compute_compatibility_score(
@@ -104,29 +336,40 @@ def compute_compatibility_score(
     - Experience level alignment (30% weight)
     - Required skills coverage (30% weight)
     """
-    matched, unmatched, overlap_pct = compute_skill_overlap(resume_skills, job_required_skills)
+    # Map job level to expected years
+    expected_min, expected_max = LEVEL_TO_YEARS.get(job_experience_level.lower(), (0, 20))
+    return _compatibility_score(
+        _skill_key(tuple(resume_skills)),
+        resume_experience_years,
+        _skill_key(tuple(job_required_skills)),
+        len(job_required_skills),
+        expected_min,
+        expected_max,
+    )
+
+
+def _compatibility_score(
+    resume_key: tuple,
+    resume_experience_years: int,
+    job_key: tuple,
+    required_count: int,
+    expected_min: int,
+    expected_max: int
+) -> Dict[str, Any]:
+    """compute_compatibility_score on pre-normalized inputs (skill keys, raw skill count, expected years)."""
+    matched, unmatched, overlap_pct = _overlap_cached(resume_key, job_key)
     
     # Skill overlap component (40%)
     skill_score = overlap_pct * 0.4
     
     # Experience level alignment (30%)
-    # Map job level to expected years
-    level_to_years = {
-        "junior": (0, 2),
-        "mid-level": (2, 5),
-        "senior": (5, 20),
-        "lead": (7, 20),
-    }
-    job_level_lower = job_experience_level.lower()
-    expected_min, expected_max = level_to_years.get(job_level_lower, (0, 20))
-    
     if resume_experience_years >= expected_min:
         exp_score = min(100, (resume_experience_years / expected_max) * 100) * 0.3
     else:
         exp_score = max(0, (resume_experience_years / expected_min) * 100) * 0.3
     
     # Required skills coverage (30%)
-    required_coverage = (len(matched) / len(job_required_skills) * 100) if job_required_skills else 0
+    required_coverage = (len(matched) / required_count * 100) if required_count else 0
     coverage_score = required_coverage * 0.3
     
     total_score = skill_score + exp_score + coverage_score
@@ -146,10 +389,16 @@ def generate_justification(
     resume_skills: List[str]
 ) -> str:
     """Generate a human-readable explanation of the match."""
-    score = compatibility["total_score"]
-    matched = compatibility["matched_skills"]
-    missing = compatibility["missing_skills"]
-    
+    return _justification_text(
+        compatibility["total_score"],
+        tuple(compatibility["matched_skills"]),
+        tuple(compatibility["missing_skills"]),
+        compatibility["experience_alignment"] == "✓ Aligned",
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _justification_text(score: float, matched: tuple, missing: tuple, aligned: bool) -> str:
     justification_parts = []
     
     if score >= 80:
@@ -167,7 +416,7 @@ def generate_justification(
     if missing:
         justification_parts.append(f"You may want to develop: {', '.join(list(missing)[:2])}.")
     
-    if compatibility["experience_alignment"] == "✓ Aligned":
+    if aligned:
         justification_parts.append("Your experience level aligns well with the role.")
     else:
         justification_parts.append("Your experience level may be below expectations for this role.")
@@ -177,7 +426,7 @@ def generate_justification(
 
 def filter_and_rank_jobs(
     resume_skills: List[str],
-    jobs_to_rank: List[Dict[str, Any]],
+    jobs_to_rank: Union[List[Dict[str, Any]], JobTable],
     experience_years: int = 3,
     min_compatibility_threshold: float = 30.0
 ) -> List[Dict[str, Any]]:
@@ -185,15 +434,30 @@ def filter_and_rank_jobs(
     Filter and rank jobs by compatibility score.
     Now accepts a list of jobs to rank (instead of using hardcoded MOCK_JOBS).
     Returns a sorted list (best matches first) with compatibility details.
+    Accepts a prebuilt JobTable to reuse its columns across calls.
     """
-    ranked_jobs = []
+    table = jobs_to_rank if isinstance(jobs_to_rank, JobTable) else JobTable.from_dicts(jobs_to_rank)
+    if not len(table):
+        return []
+    
+    # Score every job in one vectorized pass over skill bitsets
+    scores = table.scores(resume_skills, experience_years)
     
-    for job in jobs_to_rank:
-        compatibility = compute_compatibility_score(
-            resume_skills=resume_skills,
-            resume_experience_years=experience_years,
-            job_required_skills=job["required_skills"],
-            job_experience_level=job["experience_level"]
+    # Pre-screen: only jobs that can reach the threshold after rounding are materialized with full
+    # details. This is exact (built from the same bitset scores), so unlike a skill-hit screen it
+    # never drops jobs that qualify on experience alone with few or no matching skills.
+    candidates = np.flatnonzero(scores >= min_compatibility_threshold - 0.05 - 1e-9)
+    # Normalize the resume once for every job below
+    resume_key = _skill_key(tuple(resume_skills))
+    ranked_jobs = []
+    for i in candidates:
+        job = table.row(i)
+        compatibility = _compatibility_score(
+            resume_key,
+            experience_years,
+            table.skill_keys[i],
+            len(job["required_skills"]),
+            *table.levels[i]
         )
         
         score = compatibility["total_score"]
@@ -209,10 +473,36 @@ def filter_and_rank_jobs(
                 "justification": justification,
             })
     
-    # Sort by score (highest first)
-    ranked_jobs.sort(key=lambda x: x["compatibility_score"], reverse=True)
-    
-    return ranked_jobs
+    # Sort by score (highest first); stable so equal scores keep input order
+    order = np.argsort([-job["compatibility_score"] for job in ranked_jobs], kind="stable")
+    return [ranked_jobs[i] for i in order]
+
+
+# Minimum seconds between background refreshes of a served cache; 0 turns them off
+JOB_REFRESH_INTERVAL = float(os.getenv("JOB_REFRESH_INTERVAL", "1800"))
+_refresh_lock = threading.Lock()
+_last_refresh = 0.0
+
+
+def _refresh_cache_in_background(keywords: str) -> None:
+    """Start a live scrape on a daemon thread (at most one in flight); its results land in the DB for later calls."""
+    global _last_refresh
+    if JOB_REFRESH_INTERVAL <= 0:
+        return
+    with _refresh_lock:
+        now = time.monotonic()
+        if _last_refresh and now - _last_refresh < JOB_REFRESH_INTERVAL:
+            return
+        _last_refresh = now
+
+    def _run():
+        try:
+            scraped = scrape_all_sources(keywords=keywords, max_jobs=50)
+            log.info("[REFRESH] Background scrape stored %d jobs", len(scraped))
+        except Exception as e:
+            log.warning("[REFRESH] Background scrape failed: %s", e)
+
+    threading.Thread(target=_run, name="job-cache-refresh", daemon=True).start()
 
 
 def scrape_real_jobs(keywords: str, location: str = "Remote") -> List[Dict[str, Any]]:
@@ -222,28 +512,28 @@ def scrape_real_jobs(keywords: str, location: str = "Remote") -> List[Dict[str,
     Returns actual jobs or empty list if scraping fails.
     """
     try:
-        from job_scraper import scrape_all_sources, get_cached_jobs
-        
         # Try to get from cache first
         cached = get_cached_jobs(max_results=100)
         
         if cached and len(cached) > 5:
-            print(f"[CACHE] Using {len(cached)} cached jobs from database")
+            log.info("[CACHE] Using %d cached jobs from database", len(cached))
+            # Stale-while-revalidate: answer from the cache now, refresh it off the request path
+            _refresh_cache_in_background(keywords)
             return cached
         
         # If cache is empty or too small, trigger a live scrape
-        print("[SCRAPER] Cache empty - triggering live scrape from Indeed, GitHub, LinkedIn...")
+        log.info("[SCRAPER] Cache empty - triggering live scrape from Indeed, GitHub, LinkedIn...")
         scraped = scrape_all_sources(keywords=keywords, max_jobs=50)
         
         if scraped:
-            print(f"[SUCCESS] Scraped {len(scraped)} REAL jobs from internet sources")
+            log.info("[SUCCESS] Scraped %d REAL jobs from internet sources", len(scraped))
             return scraped
         else:
-            print("[WARNING] Scraping returned no results. Using fallback mock data.")
+            log.warning("[WARNING] Scraping returned no results. Using fallback mock data.")
             return FALLBACK_MOCK_JOBS
             
     except Exception as e:
-        print(f"[ERROR] Scraping error: {e}. Using fallback mock data.")
+        log.error("[ERROR] Scraping error: %s. Using fallback mock data.", e)
         return FALLBACK_MOCK_JOBS
 
 
@@ -265,8 +555,8 @@ def discover_jobs_for_resume(
     # Get REAL jobs from internet sources
     all_jobs = scrape_real_jobs(" ".join(resume_skills))
     
-    # Rank them by compatibility with resume
-    ranked = filter_and_rank_jobs(resume_skills, all_jobs, experience_years, min_score_threshold)
+    # Rank them by compatibility with resume (columns built once from the scraped dicts)
+    ranked = filter_and_rank_jobs(resume_skills, JobTable.from_dicts(all_jobs), experience_years, min_score_threshold)
     
     return {
         "total_jobs_found": len(all_jobs),
@@ -12,13 +12,24 @@ Stores all jobs in SQLite database for reuse.
 """
 
 import os
+import asyncio
+import atexit
+import functools
+import hashlib
+import json
+import re
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import time
-from typing import List, Dict, Any, Optional
-from urllib.parse import urljoin, quote
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Callable
+from urllib.parse import urljoin, quote, urlparse, urlencode
 import random
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 # Optional Selenium support
 try:
@@ -29,6 +40,28 @@ try:
 except Exception:
     SELENIUM_AVAILABLE = False
 
+# Optional aiohttp: fetches all pages of a source concurrently; without it pages are fetched one by one with requests
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except Exception:
+    AIOHTTP_AVAILABLE = False
+
+# Optional lxml: C-based parser for BeautifulSoup; the pure-Python html.parser otherwise
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except Exception:
+    LXML_AVAILABLE = False
+HTML_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
+# Optional selectolax (Lexbor): preferred over BeautifulSoup for job-card pages when installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except Exception:
+    SELECTOLAX_AVAILABLE = False
+
 try:
     from job_database import save_jobs_batch, get_all_jobs
 except ImportError:
@@ -44,12 +77,281 @@ USER_AGENTS = [
 ]
 
 
+# Max requests in flight per host on the aiohttp path; other hosts get DEFAULT_HOST_CONCURRENCY
+HOST_CONCURRENCY = {
+    "www.indeed.com": 5,
+    "www.linkedin.com": 3,
+    "jobs.github.com": 10,
+}
+DEFAULT_HOST_CONCURRENCY = 5
+# Random pause (seconds) taken inside each aiohttp slot before its request, so a host isn't hit in one burst
+REQUEST_SPACING = (0.2, 0.6)
+# The aiohttp path retries throttled/unavailable responses like _SESSION does: it waits Retry-After
+# (capped at MAX_RETRY_AFTER seconds) when the host sends one, else backs off exponentially
+ASYNC_RETRY_STATUSES = frozenset({429, 503})
+ASYNC_MAX_RETRIES = 3
+ASYNC_RETRY_BACKOFF = 0.5
+MAX_RETRY_AFTER = 30.0
+
+
+# One pooled session for every requests-based fetch, so pages on the same host reuse TCP/TLS connections.
+# Retries back off on throttling/server errors (honouring Retry-After on 429/503).
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+))
+atexit.register(_SESSION.close)
+
+
+# 64-bit BLAKE2b: stable across runs (unlike the salted built-in hash()) and collision-safe at scrape volumes
+_hash = functools.partial(hashlib.blake2b, digest_size=8)
+
+
+def _job_digest(title: str, company: str) -> str:
+    """Deterministic listing ID suffix for sources that don't expose their own job IDs."""
+    return _hash(f"{title}|{company}".encode()).hexdigest()
+
+
+# Fetched result pages are kept on disk for SCRAPE_CACHE_TTL seconds (0 disables), so re-running
+# a scrape shortly after the last one reads files instead of re-downloading every page
+SCRAPE_CACHE_DIR = os.getenv("SCRAPE_CACHE_DIR") or os.path.join(os.path.dirname(__file__), ".scrape_cache")
+SCRAPE_CACHE_TTL = float(os.getenv("SCRAPE_CACHE_TTL", "900"))
+# Search URLs vary with every resume's keywords, so the directory is swept for expired pages (and
+# trimmed to the newest SCRAPE_CACHE_MAX_ENTRIES) at most once per SCRAPE_CACHE_SWEEP_INTERVAL seconds
+SCRAPE_CACHE_MAX_ENTRIES = 500
+SCRAPE_CACHE_SWEEP_INTERVAL = 60
+_CACHE_SWEPT_AT = 0.0
+
+
+def _cache_path(url: str, params: Optional[dict]) -> str:
+    key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+    return os.path.join(SCRAPE_CACHE_DIR, _hash(key.encode()).hexdigest() + ".html")
+
+
+def _cache_get(url: str, params: Optional[dict] = None) -> Optional[bytes]:
+    """Cached body for this request if it's younger than SCRAPE_CACHE_TTL, else None."""
+    if SCRAPE_CACHE_TTL <= 0:
+        return None
+    path = _cache_path(url, params)
+    try:
+        if time.time() - os.path.getmtime(path) < SCRAPE_CACHE_TTL:
+            with open(path, "rb") as f:
+                return f.read()
+        os.remove(path)
+    except OSError:
+        pass
+    return None
+
+
+def _sweep_cache() -> None:
+    """Delete expired pages (and stray temp files), then the oldest pages beyond SCRAPE_CACHE_MAX_ENTRIES."""
+    global _CACHE_SWEPT_AT
+    now = time.time()
+    if now - _CACHE_SWEPT_AT < SCRAPE_CACHE_SWEEP_INTERVAL:
+        return
+    _CACHE_SWEPT_AT = now
+    try:
+        entries = []
+        for entry in os.scandir(SCRAPE_CACHE_DIR):
+            try:
+                mtime = entry.stat().st_mtime
+                if now - mtime >= SCRAPE_CACHE_TTL:
+                    os.remove(entry.path)
+                elif entry.name.endswith(".html"):
+                    entries.append((mtime, entry.path))
+            except OSError:
+                continue
+        entries.sort()
+        for _, path in entries[:max(0, len(entries) - SCRAPE_CACHE_MAX_ENTRIES)]:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+    except OSError:
+        pass
+
+
+def _cache_put(url: str, params: Optional[dict], body: bytes) -> None:
+    if SCRAPE_CACHE_TTL <= 0:
+        return
+    try:
+        os.makedirs(SCRAPE_CACHE_DIR, exist_ok=True)
+        path = _cache_path(url, params)
+        # Write then rename, so concurrent scrapes never read a half-written page
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(body)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"   [CACHE] Could not cache {url}: {e}")
+    _sweep_cache()
+
+
+def _render_page(driver, url: str, card_class: str) -> tuple:
+    """`(job cards, from_cache)` for `url` rendered by the Selenium `driver`, served from the page cache when fresh.
+
+    Only pages with at least one card are cached, so a block/CAPTCHA page isn't replayed for SCRAPE_CACHE_TTL.
+    """
+    cached = _cache_get(url)
+    if cached is not None:
+        return _parse_cards(cached, card_class), True
+    driver.get(url)
+    time.sleep(2)  # allow JS to render
+    html = driver.page_source
+    job_cards = _parse_cards(html, card_class)
+    if job_cards:
+        _cache_put(url, None, html.encode("utf-8"))
+    return job_cards, False
+
+
 def get_random_user_agent() -> str:
     """Get a random user agent."""
     return random.choice(USER_AGENTS)
 
 
-def scrape_indeed_jobs(keywords: str, location: str = "", pages: int = 2, driver: Optional[object] = None) -> List[Dict[str, Any]]:
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None if absent/unparseable."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+async def _fetch_async(session, semaphore, url: str, params: Optional[dict], headers: dict) -> bytes:
+    async with semaphore:
+        await asyncio.sleep(random.uniform(*REQUEST_SPACING))
+        for attempt in range(ASYNC_MAX_RETRIES + 1):
+            async with session.get(url, params=params, headers=headers) as response:
+                if response.status not in ASYNC_RETRY_STATUSES or attempt == ASYNC_MAX_RETRIES:
+                    response.raise_for_status()
+                    return await response.read()
+                wait = _retry_after_seconds(response.headers.get("Retry-After"))
+            # The host slot stays held while waiting, so other requests to a throttled host wait too
+            await asyncio.sleep(min(MAX_RETRY_AFTER, ASYNC_RETRY_BACKOFF * 2 ** attempt if wait is None else wait))
+
+
+async def _gather_pages(page_requests: List[tuple], concurrency: Optional[int]) -> list:
+    # Semaphores belong to the running loop, so each fetch_pages() call makes its own
+    semaphores = {}
+    for url, _, _ in page_requests:
+        host = urlparse(url).hostname
+        if host not in semaphores:
+            semaphores[host] = asyncio.Semaphore(concurrency or HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY))
+
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+        return await asyncio.gather(
+            *(_fetch_async(session, semaphores[urlparse(url).hostname], url, params, headers)
+              for url, params, headers in page_requests),
+            return_exceptions=True,
+        )
+
+
+def fetch_pages(
+    page_requests: List[tuple],
+    delay: tuple = (2, 4),
+    concurrency: Optional[int] = None,
+    keep: Optional[Callable[[bytes], bool]] = None,
+) -> list:
+    """Fetch each `(url, params, headers)`; returns the body bytes, or the exception raised, per request in order.
+
+    Fresh pages come from the on-disk page cache. For the rest, with aiohttp up to
+    `concurrency` requests per host (default HOST_CONCURRENCY) are in flight at once; the
+    requests fallback fetches them in turn with a random `delay` (seconds) between pages.
+    Fetched bodies are cached only when `keep(body)` is true (all of them without `keep`).
+    """
+    bodies = [_cache_get(url, params) for url, params, _ in page_requests]
+    misses = [i for i, body in enumerate(bodies) if body is None]
+    if not misses:
+        return bodies
+
+    if AIOHTTP_AVAILABLE:
+        fetched = asyncio.run(_gather_pages([page_requests[i] for i in misses], concurrency))
+    else:
+        fetched = []
+        for n, i in enumerate(misses):
+            if n:
+                time.sleep(random.uniform(*delay))
+            url, params, headers = page_requests[i]
+            try:
+                response = _SESSION.get(url, params=params, headers=headers, timeout=10)
+                response.raise_for_status()
+                fetched.append(response.content)
+            except Exception as e:
+                fetched.append(e)
+
+    for i, body in zip(misses, fetched):
+        if not isinstance(body, Exception) and (keep is None or keep(body)):
+            _cache_put(page_requests[i][0], page_requests[i][1], body)
+        bodies[i] = body
+    return bodies
+
+
+def _page_body(bodies: list, page: int) -> bytes:
+    body = bodies[page]
+    if isinstance(body, Exception):
+        raise body
+    return body
+
+
+class _LexborCard:
+    """The slice of bs4's Tag API the card loops use (find / get_text / get), over a selectolax node."""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        self._node = node
+
+    def find(self, name: str, class_: Optional[str] = None) -> Optional["_LexborCard"]:
+        selector = f"{name}.{class_}" if class_ else name
+        node = self._node.css_first(selector)
+        if node is not None and node == self._node:
+            # CSS matching includes the node itself; bs4's find() only searches descendants
+            node = next(iter(self._node.css(selector)[1:]), None)
+        return _LexborCard(node) if node is not None else None
+
+    def get_text(self, strip: bool = False) -> str:
+        return self._node.text(strip=strip)
+
+    def get(self, key: str, default=None):
+        value = self._node.attributes.get(key)
+        return default if value is None else value
+
+
+def _parse_cards(markup, card_class: str) -> list:
+    """The `<div class=card_class>` job cards of a results page; only those subtrees are built."""
+    if SELECTOLAX_AVAILABLE:
+        return [_LexborCard(node) for node in LexborHTMLParser(markup).css(f"div.{card_class}")]
+    only = SoupStrainer("div", class_=card_class)
+    return BeautifulSoup(markup, HTML_PARSER, parse_only=only).find_all("div", class_=card_class)
+
+
+def _has_cards(card_class: str) -> Callable[[bytes], bool]:
+    """`keep` predicate for fetch_pages: cache a result page only if it holds at least one job card."""
+    return lambda body: bool(_parse_cards(body, card_class))
+
+
+def _has_json_jobs(body: bytes) -> bool:
+    try:
+        return bool(json.loads(body))
+    except ValueError:
+        return False
+
+
+def scrape_indeed_jobs(
+    keywords: str,
+    location: str = "",
+    pages: int = 2,
+    driver: Optional[object] = None,
+    concurrency: Optional[int] = None,
+) -> List[Dict[str, Any]]:
     """Scrape Indeed.com for job listings.
 
     If a Selenium `driver` is provided, it will be used to render pages (useful when
@@ -59,40 +361,42 @@ def scrape_indeed_jobs(keywords: str, location: str = "", pages: int = 2, driver
     base_url = "https://www.indeed.com/jobs"
     print(f"[SCRAPER] Scraping Indeed for: {keywords}")
     
-    for page in range(pages):
-        try:
-            params = {
+    page_requests = [
+        (
+            base_url,
+            {
                 "q": keywords,
                 "l": location if location else "Remote",
                 "start": page * 10,
-            }
-            
-            headers = {
+            },
+            {
                 "User-Agent": get_random_user_agent(),
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
                 "Referer": "https://www.google.com/",
-            }
-            
+            },
+        )
+        for page in range(pages)
+    ]
+    use_driver = driver is not None and SELENIUM_AVAILABLE
+    # Without a browser every page is fetched up front (concurrently when aiohttp is installed)
+    bodies = None if use_driver else fetch_pages(page_requests, concurrency=concurrency, keep=_has_cards("job_seen_beacon"))
+    
+    for page, (_, params, headers) in enumerate(page_requests):
+        from_cache = False
+        try:
             # If a Selenium driver was provided, use it to render the page (helps with JS-heavy pages)
-            if driver is not None and SELENIUM_AVAILABLE:
+            if use_driver:
                 search_url = f"{base_url}?q={quote(keywords)}&l={quote(location if location else 'Remote')}&start={page * 10}"
                 try:
-                    driver.get(search_url)
-                    time.sleep(2)  # allow JS to render
-                    html = driver.page_source
-                    soup = BeautifulSoup(html, "html.parser")
+                    job_cards, from_cache = _render_page(driver, search_url, "job_seen_beacon")
                 except Exception as e:
                     print(f"   [SELENIUM] Indeed render error: {e}. Falling back to requests")
-                    response = requests.get(base_url, params=params, headers=headers, timeout=10)
+                    response = _SESSION.get(base_url, params=params, headers=headers, timeout=10)
                     response.raise_for_status()
-                    soup = BeautifulSoup(response.content, "html.parser")
+                    job_cards = _parse_cards(response.content, "job_seen_beacon")
             else:
-                response = requests.get(base_url, params=params, headers=headers, timeout=10)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, "html.parser")
-            
-            # Find job cards on Indeed
-            job_cards = soup.find_all("div", class_="job_seen_beacon")
+                # Find job cards on Indeed
+                job_cards = _parse_cards(_page_body(bodies, page), "job_seen_beacon")
             
             for card in job_cards:
                 try:
@@ -117,7 +421,7 @@ def scrape_indeed_jobs(keywords: str, location: str = "", pages: int = 2, driver
                         job_url = urljoin(base_url, job_url)
                     
                     job = {
-                        "id": f"indeed_{hash(title + company) % 1000000}",
+                        "id": f"indeed_{_job_digest(title, company)}",
                         "title": title,
                         "company": company,
                         "location": location_text,
@@ -134,7 +438,8 @@ def scrape_indeed_jobs(keywords: str, location: str = "", pages: int = 2, driver
                     continue
             
             print(f"   [PAGE] Page {page + 1}: Found {len(job_cards)} jobs")
-            time.sleep(random.uniform(2, 4))
+            if use_driver and not from_cache:
+                time.sleep(random.uniform(2, 4))
             
         except Exception as e:
             print(f"   [ERROR] Error on page {page}: {str(e)[:200]}")
@@ -143,27 +448,22 @@ def scrape_indeed_jobs(keywords: str, location: str = "", pages: int = 2, driver
     return jobs
 
 
-def scrape_github_jobs_api(keywords: str = "python", pages: int = 1) -> List[Dict[str, Any]]:
+def scrape_github_jobs_api(keywords: str = "python", pages: int = 1, concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
     """Scrape from GitHub Jobs API."""
     jobs = []
     
     print(f"[SCRAPER] Scraping GitHub Jobs for: {keywords}")
     
     try:
+        url = "https://jobs.github.com/api/positions.json"
+        page_requests = [
+            (url, {"description": keywords, "page": page}, {"User-Agent": get_random_user_agent()})
+            for page in range(pages)
+        ]
+        bodies = fetch_pages(page_requests, delay=(1, 2), concurrency=concurrency, keep=_has_json_jobs)
+        
         for page in range(pages):
-            url = "https://jobs.github.com/api/positions.json"
-            
-            params = {
-                "description": keywords,
-                "page": page,
-            }
-            
-            headers = {"User-Agent": get_random_user_agent()}
-            
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = json.loads(_page_body(bodies, page))
             
             if not data:
                 break
@@ -187,7 +487,6 @@ def scrape_github_jobs_api(keywords: str = "python", pages: int = 1) -> List[Dic
                     continue
             
             print(f"   [PAGE] Page {page + 1}: Found {len(data)} jobs")
-            time.sleep(random.uniform(1, 2))
             
     except Exception as e:
         print(f"   [ERROR] GitHub Jobs error: {str(e)[:200]}")
@@ -195,7 +494,12 @@ def scrape_github_jobs_api(keywords: str = "python", pages: int = 1) -> List[Dic
     return jobs
 
 
-def scrape_linkedin_jobs(keywords: str = "python", pages: int = 1, driver: Optional[object] = None) -> List[Dict[str, Any]]:
+def scrape_linkedin_jobs(
+    keywords: str = "python",
+    pages: int = 1,
+    driver: Optional[object] = None,
+    concurrency: Optional[int] = None,
+) -> List[Dict[str, Any]]:
     """Scrape LinkedIn Jobs.
 
     Uses requests by default; LinkedIn is often dynamic and may require Selenium.
@@ -205,28 +509,28 @@ def scrape_linkedin_jobs(keywords: str = "python", pages: int = 1, driver: Optio
     print(f"[SCRAPER] Scraping LinkedIn for: {keywords}")
     
     try:
-        for page in range(pages):
-            # LinkedIn search page (guest) - prefer Selenium when available
-            search_url = f"https://www.linkedin.com/jobs/search/?keywords={quote(keywords)}&start={page * 25}"
-            headers = {"User-Agent": get_random_user_agent()}
-
+        # LinkedIn search page (guest) - prefer Selenium when available
+        page_requests = [
+            (f"https://www.linkedin.com/jobs/search/?keywords={quote(keywords)}&start={page * 25}", None,
+             {"User-Agent": get_random_user_agent()})
+            for page in range(pages)
+        ]
+        use_driver = driver is not None and SELENIUM_AVAILABLE
+        bodies = None if use_driver else fetch_pages(page_requests, concurrency=concurrency, keep=_has_cards("base-card"))
+        
+        for page, (search_url, _, headers) in enumerate(page_requests):
+            from_cache = False
             # Use provided Selenium driver if available, otherwise fall back to requests
-            if driver is not None and SELENIUM_AVAILABLE:
+            if use_driver:
                 try:
-                    driver.get(search_url)
-                    time.sleep(2)
-                    html = driver.page_source
-                    soup = BeautifulSoup(html, "html.parser")
+                    job_cards, from_cache = _render_page(driver, search_url, "base-card")
                 except Exception:
-                    response = requests.get(search_url, headers=headers, timeout=10)
+                    response = _SESSION.get(search_url, headers=headers, timeout=10)
                     response.raise_for_status()
-                    soup = BeautifulSoup(response.content, "html.parser")
+                    job_cards = _parse_cards(response.content, "base-card")
             
             else:
-                response = requests.get(search_url, headers=headers, timeout=10)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, "html.parser")
-            job_cards = soup.find_all("div", class_="base-card")
+                job_cards = _parse_cards(_page_body(bodies, page), "base-card")
             
             for card in job_cards:
                 try:
@@ -237,7 +541,7 @@ def scrape_linkedin_jobs(keywords: str = "python", pages: int = 1, driver: Optio
                     
                     if title_elem and company_elem:
                         job = {
-                            "id": f"linkedin_{hash(title_elem.text + company_elem.text) % 1000000}",
+                            "id": f"linkedin_{_job_digest(title_elem.get_text(strip=True), company_elem.get_text(strip=True))}",
                             "title": title_elem.get_text(strip=True),
                             "company": company_elem.get_text(strip=True),
                             "location": location_elem.get_text(strip=True) if location_elem else "Not specified",
@@ -253,7 +557,8 @@ def scrape_linkedin_jobs(keywords: str = "python", pages: int = 1, driver: Optio
                     continue
             
             print(f"   [PAGE] Page {page + 1}: Found {len(job_cards)} jobs")
-            time.sleep(random.uniform(2, 4))
+            if use_driver and not from_cache:
+                time.sleep(random.uniform(2, 4))
             
     except Exception as e:
         print(f"   [ERROR] LinkedIn error: {str(e)[:200]}")
@@ -261,41 +566,61 @@ def scrape_linkedin_jobs(keywords: str = "python", pages: int = 1, driver: Optio
     return jobs
 
 
+# Lowercase substring -> display name, built once rather than on every call
+SKILL_KEYWORDS = {
+    "python": "Python", "javascript": "JavaScript", "typescript": "TypeScript",
+    "java": "Java", "c++": "C++", "c#": "C#", "go": "Go", "rust": "Rust",
+    "react": "React", "vue": "Vue", "angular": "Angular",
+    "node.js": "Node.js", "django": "Django", "flask": "Flask", "fastapi": "FastAPI",
+    "sql": "SQL", "mysql": "MySQL", "postgresql": "PostgreSQL", "mongodb": "MongoDB",
+    "docker": "Docker", "kubernetes": "Kubernetes", "aws": "AWS", "gcp": "GCP",
+    "git": "Git", "ci/cd": "CI/CD", "devops": "DevOps", "linux": "Linux",
+    "machine learning": "Machine Learning", "tensorflow": "TensorFlow",
+    "pandas": "pandas", "numpy": "numpy", "scikit-learn": "scikit-learn",
+    "rest api": "REST API", "graphql": "GraphQL",
+    "html": "HTML", "css": "CSS",
+}
+
+
+# A skill only counts as a whole token: not inside a longer word ("java" in "javascript", "git" in
+# "github", "sql" in "mysql"); a version number may follow ("python3", "html5")
+_SKILL_END_RES = {skill_key: re.compile(re.escape(skill_key) + r"(?![a-z+#])") for skill_key in SKILL_KEYWORDS}
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+
+def _has_skill_token(text_lower: str, skill_key: str) -> bool:
+    # Patterns start with the literal so re can scan for it quickly; the character before is checked here
+    for m in _SKILL_END_RES[skill_key].finditer(text_lower):
+        start = m.start()
+        if start == 0 or text_lower[start - 1] not in _WORD_CHARS:
+            return True
+    return False
+
+
 def extract_skills_from_text(text: str) -> List[str]:
     """Extract common programming skills from text."""
-    skills_dict = {
-        "python": "Python", "javascript": "JavaScript", "typescript": "TypeScript",
-        "java": "Java", "c++": "C++", "c#": "C#", "go": "Go", "rust": "Rust",
-        "react": "React", "vue": "Vue", "angular": "Angular",
-        "node.js": "Node.js", "django": "Django", "flask": "Flask", "fastapi": "FastAPI",
-        "sql": "SQL", "mysql": "MySQL", "postgresql": "PostgreSQL", "mongodb": "MongoDB",
-        "docker": "Docker", "kubernetes": "Kubernetes", "aws": "AWS", "gcp": "GCP",
-        "git": "Git", "ci/cd": "CI/CD", "devops": "DevOps", "linux": "Linux",
-        "machine learning": "Machine Learning", "tensorflow": "TensorFlow",
-        "pandas": "pandas", "numpy": "numpy", "scikit-learn": "scikit-learn",
-        "rest api": "REST API", "graphql": "GraphQL",
-        "html": "HTML", "css": "CSS",
-    }
-    
     text_lower = text.lower()
     found_skills = []
     
-    for skill_key, skill_name in skills_dict.items():
-        if skill_key in text_lower:
+    # The C-level substring test rules out most keys cheaply; only candidates get the token check
+    for skill_key, skill_name in SKILL_KEYWORDS.items():
+        if skill_key in text_lower and _has_skill_token(text_lower, skill_key):
             found_skills.append(skill_name)
     
-    return list(set(found_skills))
+    # Dedupe keys that map to the same skill, keeping SKILL_KEYWORDS order so results are stable
+    return list(dict.fromkeys(found_skills))
 
 
 def infer_experience_level(title: str) -> str:
     """Infer experience level from job title."""
     title_lower = title.lower()
     
-    if any(word in title_lower for word in ["senior", "lead", "principal", "architect"]):
+    # Inline substring tests: no per-call list or generator, and the first hit short-circuits
+    if "senior" in title_lower or "lead" in title_lower or "principal" in title_lower or "architect" in title_lower:
         return "Senior"
-    elif any(word in title_lower for word in ["mid", "intermediate"]):
+    elif "mid" in title_lower or "intermediate" in title_lower:
         return "Mid-level"
-    elif any(word in title_lower for word in ["junior", "entry", "graduate"]):
+    elif "junior" in title_lower or "entry" in title_lower or "graduate" in title_lower:
         return "Junior"
     else:
         return "Not specified"
@@ -331,33 +656,118 @@ def _init_selenium_driver(driver_path: Optional[str] = None, headless: bool = Tr
         return None
 
 
-def scrape_all_sources(keywords: str = "python developer", max_jobs: int = 100, use_selenium: bool = True) -> List[Dict[str, Any]]:
-    """Scrape from ALL sources and save to database."""
+# Chrome instances reused across scrapes, keyed by (headless, driver_path) -> (driver, lock).
+# A WebDriver is not thread-safe, so whoever drives it holds its lock.
+_DRIVER_CACHE: Dict[tuple, tuple] = {}
+_DRIVER_CACHE_LOCK = threading.Lock()
+
+
+def _driver_alive(driver, lock) -> bool:
+    if not lock.acquire(blocking=False):
+        return True  # busy in another scrape
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+    finally:
+        lock.release()
+
+
+def get_driver(headless: bool = True, driver_path: Optional[str] = None) -> tuple:
+    """Shared `(driver, lock)` for these options, starting Chrome on first use; `(None, None)` if unavailable."""
+    key = (headless, driver_path)
+    with _DRIVER_CACHE_LOCK:
+        entry = _DRIVER_CACHE.get(key)
+        if entry is not None and not _driver_alive(*entry):
+            # Browser crashed or was closed: replace it
+            _quit_driver(entry[0])
+            entry = None
+        if entry is None:
+            driver = _init_selenium_driver(driver_path=driver_path, headless=headless)
+            if driver is None:
+                return None, None
+            entry = _DRIVER_CACHE[key] = (driver, threading.Lock())
+        return entry
+
+
+def _quit_driver(driver) -> None:
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def _quit_cached_drivers() -> None:
+    with _DRIVER_CACHE_LOCK:
+        for driver, _ in _DRIVER_CACHE.values():
+            _quit_driver(driver)
+        _DRIVER_CACHE.clear()
+
+
+atexit.register(_quit_cached_drivers)
+
+
+def scrape_all_sources(
+    keywords: str = "python developer",
+    max_jobs: int = 100,
+    use_selenium: bool = True,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[str, int], None]] = None,
+    concurrency: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Scrape from ALL sources concurrently and save to database.
+
+    Each source runs on its own worker thread (one in-flight scraper per domain). Within a
+    source, `concurrency` caps its parallel page requests (default: HOST_CONCURRENCY).
+    `progress_callback(source, n_jobs)` is called from the calling thread as each source finishes.
+    """
     all_jobs = []
     
     print(f"\n{'='*60}")
     print(f"[SCRAPER] STARTING JOB SCRAPE: {keywords}")
     print(f"{'='*60}\n")
 
-    # Initialize Selenium driver if requested and available
-    driver = None
+    # Shared Selenium driver if requested and available (started once per process, see get_driver)
+    driver, driver_lock = None, None
     if use_selenium:
         driver_path = os.getenv("CHROME_DRIVER_PATH") or None
-        driver = _init_selenium_driver(driver_path=driver_path, headless=True)
+        driver, driver_lock = get_driver(headless=True, driver_path=driver_path)
         if driver:
-            print("[SELENIUM] WebDriver initialized and will be used for dynamic pages")
+            print("[SELENIUM] WebDriver ready and will be used for dynamic pages")
         else:
             print("[SELENIUM] WebDriver not available; falling back to requests-based scraping")
 
     # Scrape from each source (pass driver to scrapers so they can use the same browser instance)
-    indeed_jobs = scrape_indeed_jobs(keywords, pages=2, driver=driver)
-    all_jobs.extend(indeed_jobs)
-    
-    github_jobs = scrape_github_jobs_api(keywords, pages=1)
-    all_jobs.extend(github_jobs)
-    
-    linkedin_jobs = scrape_linkedin_jobs(keywords, pages=1, driver=driver)
-    all_jobs.extend(linkedin_jobs)
+    # (source name, scraper, whether it drives the shared browser)
+    sources = [
+        ("Indeed", lambda: scrape_indeed_jobs(keywords, pages=2, driver=driver, concurrency=concurrency), True),
+        ("GitHub Jobs", lambda: scrape_github_jobs_api(keywords, pages=1, concurrency=concurrency), False),
+        ("LinkedIn", lambda: scrape_linkedin_jobs(keywords, pages=1, driver=driver, concurrency=concurrency), True),
+    ]
+
+    def _run_source(scrape_fn, uses_driver):
+        if uses_driver and driver is not None:
+            with driver_lock:
+                return scrape_fn()
+        return scrape_fn()
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers or len(sources)) as pool:
+        futures = {pool.submit(_run_source, fn, uses_driver): name for name, fn, uses_driver in sources}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                print(f"   [ERROR] {name} scraper failed: {str(e)[:200]}")
+                results[name] = []
+            if progress_callback:
+                progress_callback(name, len(results[name]))
+
+    # Keep a stable source order regardless of which finished first
+    for name, _, _ in sources:
+        all_jobs.extend(results.get(name, []))
     
     # Remove duplicates by ID
     unique_jobs = {job['id']: job for job in all_jobs}
@@ -375,20 +785,9 @@ def scrape_all_sources(keywords: str = "python developer", max_jobs: int = 100,
         print(f"   Saved to database: {saved_count}")
     except Exception as e:
         print(f"   Database save error: {e}")
-        if driver:
-            try:
-                driver.quit()
-            except Exception:
-                pass
         return all_jobs
     
     print(f"\n[COMPLETE] Scraping complete!\n")
-    if driver:
-        try:
-            driver.quit()
-        except Exception:
-            pass
-    
     return all_jobs
 
 
@@ -16,15 +16,19 @@ import os
 import sys
 import json
 import re
+import functools
 import importlib
-from typing import Dict, Any, List, Optional
+import multiprocessing
+from io import BytesIO
+from typing import Dict, Any, List, Optional, Union, BinaryIO
 
 # ---------------------- PDF TEXT EXTRACTION WITH FALLBACKS ----------------------
 
+@functools.lru_cache(maxsize=1)
 def _import_pdf_text_extractors():
     """
     Try to import PDF text extraction libraries in order of preference.
-    Returns a dict with available extractors.
+    Returns a dict with available extractors (resolved once per process; don't mutate it).
     """
     available = {}
 
@@ -45,45 +49,87 @@ def _import_pdf_text_extractors():
     return available
 
 
-def extract_text_from_pdf_with_fallback(pdf_path: str) -> str:
+# Stop reading pages once this many characters are extracted (0 = no limit), so huge PDFs can't exhaust memory
+PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", "200000"))
+
+
+def _join_pages(page_texts, max_chars: int) -> str:
+    """'\\n'.join of `page_texts`, pulling pages one at a time and stopping once `max_chars` is reached."""
+    parts = []
+    total = 0
+    for text in page_texts:
+        parts.append(text)
+        total += len(text) + 1
+        if max_chars and total >= max_chars:
+            break
+    joined = "\n".join(parts)
+    return joined[:max_chars] if max_chars else joined
+
+
+def _pdfplumber_page_texts(pdf):
+    for page in pdf.pages:
+        text = page.extract_text() or ""
+        # Drop the page's parsed layout objects before moving on to the next page
+        page.flush_cache()
+        yield text
+
+
+def _pypdf2_page_texts(pages):
+    for p in pages:
+        try:
+            yield p.extract_text() or ""
+        except Exception:
+            # fallback: try reading /data as string
+            yield ""
+
+
+def extract_text_from_pdf_with_fallback(pdf_path: Union[str, bytes, BinaryIO], max_chars: Optional[int] = None) -> str:
     """
     Extract text from a PDF file using any available library. If none are
     available, raise RuntimeError with actionable instructions.
+
+    `pdf_path` may also be the PDF's raw bytes or a binary file-like object,
+    which avoids writing uploads to a temporary file first. Text is truncated
+    to `max_chars` (default PDF_MAX_CHARS; 0 for no limit).
     """
+    if max_chars is None:
+        max_chars = PDF_MAX_CHARS
     available = _import_pdf_text_extractors()
+    if isinstance(pdf_path, (bytes, bytearray, memoryview)):
+        pdf_path = BytesIO(bytes(pdf_path))
 
     if "pdfplumber" in available:
         pdfplumber = available["pdfplumber"]
         # pdfplumber API
+        if not isinstance(pdf_path, str):
+            pdf_path.seek(0)
         with pdfplumber.open(pdf_path) as pdf:
-            pages = [p.extract_text() or "" for p in pdf.pages]
-        return "\n".join(pages)
+            return _join_pages(_pdfplumber_page_texts(pdf), max_chars)
 
     if "pypdf2" in available:
         PyPDF2 = available["pypdf2"]
         # Different PyPDF2 versions have different APIs (PdfReader vs PdfFileReader)
         try:
             # Newer PyPDF2: PdfReader
+            if not isinstance(pdf_path, str):
+                pdf_path.seek(0)
             reader = PyPDF2.PdfReader(pdf_path)
-            pages = []
-            for p in reader.pages:
-                try:
-                    pages.append(p.extract_text() or "")
-                except Exception:
-                    # fallback: try reading /data as string
-                    pages.append("")
-            return "\n".join(pages)
+            return _join_pages(_pypdf2_page_texts(reader.pages), max_chars)
         except Exception:
             try:
                 # Older API
-                reader = PyPDF2.PdfFileReader(open(pdf_path, "rb"))
-                pages = []
-                for i in range(reader.getNumPages()):
-                    try:
-                        pages.append(reader.getPage(i).extractText() or "")
-                    except Exception:
-                        pages.append("")
-                return "\n".join(pages)
+                if not isinstance(pdf_path, str):
+                    pdf_path.seek(0)
+                reader = PyPDF2.PdfFileReader(open(pdf_path, "rb") if isinstance(pdf_path, str) else pdf_path)
+
+                def _old_api_page_texts():
+                    for i in range(reader.getNumPages()):
+                        try:
+                            yield reader.getPage(i).extractText() or ""
+                        except Exception:
+                            yield ""
+
+                return _join_pages(_old_api_page_texts(), max_chars)
             except Exception:
                 pass
 
@@ -103,9 +149,62 @@ def extract_text_from_txt(txt_path: str) -> str:
 
 # ---------------------- INFORMATION EXTRACTION ----------------------
 
+# Patterns are compiled once at import rather than looked up/parsed on each call
+_WS_RE = re.compile(r"\s+")
+_EDU_RES = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"\b(BS|B\.S\.|Bachelor[^,\n]*)\b[\s\S]{0,80}",
+        r"\b(MS|M\.S\.|Master[^,\n]*)\b[\s\S]{0,80}",
+        r"\b(Bachelor of [^,\n]+)\b",
+        r"\b(Master of [^,\n]+)\b",
+        r"\b(High School|Intermediate|Matriculation|Matric)\b[\s\S]{0,40}",
+        r"\b(Ph\.D|PhD|Doctorate)\b[\s\S]{0,80}",
+    )
+]
+_SECTION_SPLIT_RE = re.compile(r"\n{2,}|\r\n{2,}")
+_EXPERIENCE_SECTION_RE = re.compile(r"\b(?:experience|worked as)\b", re.IGNORECASE)
+_EXP_YEARS_RE = re.compile(r"([A-Za-z &,-]{2,60})\s+[-@\|]?\s*(\d+)\s+years?", re.IGNORECASE)
+_PROJ_RE = re.compile(r"(Project[s]?[:\-]?\s*)([\s\S]{1,300}?)(?=(\n\n|$|\n[A-Z]))", re.IGNORECASE)
+
+
 def normalize_text(text: str) -> str:
     """Normalize whitespace and remove weird characters for easier regexing."""
-    return re.sub(r"\s+", " ", text).strip()
+    return _WS_RE.sub(" ", text).strip()
+
+
+# Alphanumeric runs, keeping trailing "+"/"#" so "c++" and "c#" stay single tokens
+_TOKEN_RE = re.compile(r"[a-z0-9]+[+#]*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase tokens of `text`, in order; multi-word skills are matched as token runs."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+_WORD_CHAR_RE = re.compile(r"\w")
+
+
+def _word_boundary_at(s: str, i: int) -> bool:
+    """Whether a regex word boundary falls between s[i - 1] and s[i]."""
+    return bool(_WORD_CHAR_RE.match(s[i - 1])) != bool(_WORD_CHAR_RE.match(s[i]))
+
+
+@functools.lru_cache(maxsize=32)
+def _skill_pattern(keywords: tuple):
+    """One-pass matcher for lowercase `keywords`.
+
+    The lookahead reports, at every position, the longest keyword matching there as a whole
+    word; `implied[k]` lists the shorter keywords that then also match at that position.
+    """
+    by_length = sorted(set(keywords), key=len, reverse=True)
+    pattern = re.compile(r"(?=\b(" + "|".join(map(re.escape, by_length)) + r")\b)")
+    implied = {
+        longer: tuple(k for k in by_length
+                      if 0 < len(k) < len(longer) and longer.startswith(k) and _word_boundary_at(longer, len(k)))
+        for longer in by_length
+    }
+    return pattern, implied
 
 
 def extract_skills(text: str, extra_keywords: Optional[List[str]] = None) -> List[str]:
@@ -117,28 +216,19 @@ def extract_skills(text: str, extra_keywords: Optional[List[str]] = None) -> Lis
     if extra_keywords:
         skill_keywords = list(dict.fromkeys(skill_keywords + extra_keywords))
 
-    lowered = text.lower()
-    found = []
-    for skill in skill_keywords:
-        # match whole word where sensible
-        pattern = r"\b" + re.escape(skill.lower()) + r"\b"
-        if re.search(pattern, lowered):
-            found.append(skill)
-    return found
+    # match whole word where sensible; all keywords in a single scan of the text
+    pattern, implied = _skill_pattern(tuple(skill.lower() for skill in skill_keywords))
+    hits = set()
+    for m in pattern.finditer(text.lower()):
+        hits.add(m.group(1))
+        hits.update(implied[m.group(1)])
+    return [skill for skill in skill_keywords if skill.lower() in hits]
 
 
 def extract_education(text: str) -> List[str]:
-    edu_patterns = [
-        r"\b(BS|B\.S\.|Bachelor[^,\n]*)\b[\s\S]{0,80}",
-        r"\b(MS|M\.S\.|Master[^,\n]*)\b[\s\S]{0,80}",
-        r"\b(Bachelor of [^,\n]+)\b",
-        r"\b(Master of [^,\n]+)\b",
-        r"\b(High School|Intermediate|Matriculation|Matric)\b[\s\S]{0,40}",
-        r"\b(Ph\.D|PhD|Doctorate)\b[\s\S]{0,80}",
-    ]
     results = []
-    for pattern in edu_patterns:
-        for m in re.finditer(pattern, text, flags=re.IGNORECASE):
+    for pattern in _EDU_RES:
+        for m in pattern.finditer(text):
             snippet = m.group(0).strip()
             if snippet not in results:
                 results.append(snippet)
@@ -151,36 +241,31 @@ def extract_experience(text: str) -> List[Dict[str, Any]]:
     or lines with 'years' e.g. '3 years', or job lines with company and dates.
     Returns a list of dicts with simple extracted info.
     """
-    experiences = []
+    # made unique as they are found: keyed by raw text when present, else role + years; first one wins
+    unique = {}
 
     # First, split by common section headings
-    sections = re.split(r"\n{2,}|\r\n{2,}", text)
+    sections = _SECTION_SPLIT_RE.split(text)
     for sec in sections:
-        if re.search(r"\bexperience\b", sec, flags=re.IGNORECASE) or re.search(r"\bworked as\b", sec, flags=re.IGNORECASE):
-            experiences.append({"raw": sec.strip()})
+        # one scan per section for either marker
+        if _EXPERIENCE_SECTION_RE.search(sec):
+            raw = sec.strip()
+            unique.setdefault(raw, {"raw": raw})
 
     # fallback: find patterns like 'X years' near job titles
-    for m in re.finditer(r"([A-Za-z &,-]{2,60})\s+[-@\|]?\s*(\d+)\s+years?", text, flags=re.IGNORECASE):
+    # (the backtracking role/years scan is skipped outright when no "year" appears at all)
+    for m in (_EXP_YEARS_RE.finditer(text) if "year" in text.lower() else ()):
         title = m.group(1).strip()
         years = int(m.group(2))
-        experiences.append({"role": title, "years": years})
-
-    # make unique by raw text when present
-    unique = []
-    seen = set()
-    for e in experiences:
-        key = e.get("raw") or (e.get("role") + str(e.get("years")))
-        if key not in seen:
-            unique.append(e)
-            seen.add(key)
+        unique.setdefault(title + str(years), {"role": title, "years": years})
 
-    return unique
+    return list(unique.values())
 
 
 def extract_projects(text: str) -> List[str]:
     # Look for lines starting with Project or Projects or 'Selected Projects'
     projects = []
-    for m in re.finditer(r"(Project[s]?[:\-]?\s*)([\s\S]{1,300}?)(?=(\n\n|$|\n[A-Z]))", text, flags=re.IGNORECASE):
+    for m in _PROJ_RE.finditer(text):
         proj = m.group(2).strip()
         if proj and proj not in projects:
             projects.append(proj)
@@ -205,13 +290,17 @@ def build_profile(text: str, extra_skill_keywords: Optional[List[str]] = None) -
     return profile
 
 
+_ADVANCED_SKILLS = frozenset({"python", "machine learning", "deep learning", "data analysis", "pandas", "numpy"})
+_INTERMEDIATE_SKILLS = frozenset({"java", "c++", "c#", "sql"})
+
+
 def identify_proficiency(skills: List[str]) -> Dict[str, str]:
     proficiency_map = {}
     for skill in skills:
         sk = skill.lower()
-        if sk in ["python", "machine learning", "deep learning", "data analysis", "pandas", "numpy"]:
+        if sk in _ADVANCED_SKILLS:
             proficiency_map[skill] = "Advanced"
-        elif sk in ["java", "c++", "c#", "sql"]:
+        elif sk in _INTERMEDIATE_SKILLS:
             proficiency_map[skill] = "Intermediate"
         else:
             proficiency_map[skill] = "Beginner"
@@ -225,27 +314,48 @@ def save_profile(profile: Dict[str, Any], output_path: str) -> None:
 
 # ---------------------- MAIN PIPELINE ----------------------
 
-def analyze_resume(path: str, output_path: str = "resume_profile.json") -> Dict[str, Any]:
-    """
-    Accepts a path to a resume file. Supports .pdf and .txt.
-    If PDF support libraries are missing, a RuntimeError will be raised with
-    guidance on how to proceed.
-    """
+def _read_resume(path: str) -> str:
     if not os.path.exists(path):
         raise FileNotFoundError(f"Input file not found: {path}")
 
     ext = os.path.splitext(path)[1].lower()
     if ext == ".pdf":
-        text = extract_text_from_pdf_with_fallback(path)
+        return extract_text_from_pdf_with_fallback(path)
     elif ext in [".txt", ".md"]:
-        text = extract_text_from_txt(path)
+        return extract_text_from_txt(path)
     else:
         raise ValueError("Unsupported file type. Please provide a .pdf or .txt resume.")
 
-    profile = build_profile(text)
+
+def analyze_resume(path: str, output_path: str = "resume_profile.json") -> Dict[str, Any]:
+    """
+    Accepts a path to a resume file. Supports .pdf and .txt.
+    If PDF support libraries are missing, a RuntimeError will be raised with
+    guidance on how to proceed.
+    """
+    profile = build_profile(_read_resume(path))
     save_profile(profile, output_path)
     return profile
 
+
+def _analyze_one(path: str) -> Dict[str, Any]:
+    # Top-level so worker processes can unpickle it; PDF libraries are imported inside each worker
+    return build_profile(_read_resume(path))
+
+
+def analyze_resumes(paths: List[str], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Build profiles for many resumes, one worker process per CPU (or `workers`),
+    since PDF parsing and the regex passes are CPU-bound. Profiles are returned
+    in `paths` order and not saved. On Windows/macOS (spawn), call this from
+    under `if __name__ == "__main__":`.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        return [_analyze_one(path) for path in paths]
+    with multiprocessing.Pool(workers) as pool:
+        return pool.map(_analyze_one, paths)
+
 # ---------------------- LIGHTWEIGHT TESTS ----------------------
 
 def _run_smoke_tests():
@@ -0,0 +1,58 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled batch scorer for job_discovery.score_all.
+
+Optional: job_discovery falls back to numba/numpy when this isn't built.
+Build in place with:  cythonize -i score_batch.pyx
+"""
+
+import numpy as np
+from libc.stdint cimport uint64_t
+
+cdef extern from *:
+    """
+    #if defined(_MSC_VER)
+    #include <intrin.h>
+    static inline int popcount64(unsigned long long x) { return (int)__popcnt64(x); }
+    #else
+    static inline int popcount64(unsigned long long x) { return __builtin_popcountll(x); }
+    #endif
+    """
+    int popcount64(unsigned long long x) nogil
+
+
+def score_batch(
+    const uint64_t[:, ::1] job_masks,
+    const uint64_t[::1] resume_mask,
+    const double[::1] unique_counts,
+    const double[::1] required_counts,
+    double years,
+    const double[::1] exp_min,
+    const double[::1] exp_max,
+):
+    """Unrounded compatibility totals per job row; same formula and operation order as score_all."""
+    cdef Py_ssize_t n = job_masks.shape[0]
+    cdef Py_ssize_t lanes = job_masks.shape[1]
+    cdef Py_ssize_t i, w
+    cdef long long count
+    cdef double matched, overlap_pct, coverage, exp
+    out = np.empty(n, dtype=np.float64)
+    cdef double[::1] scores = out
+
+    with nogil:
+        for i in range(n):
+            count = 0
+            for w in range(lanes):
+                count += popcount64(job_masks[i, w] & resume_mask[w])
+            matched = <double>count
+
+            overlap_pct = matched / unique_counts[i] * 100 if unique_counts[i] > 0 else 0.0
+            coverage = matched / required_counts[i] * 100 if required_counts[i] > 0 else 0.0
+            if years >= exp_min[i]:
+                exp = min(100.0, years / exp_max[i] * 100)
+            else:
+                exp = max(0.0, years / exp_min[i] * 100)
+
+            scores[i] = overlap_pct * 0.4 + exp * 0.3 + coverage * 0.3
+
+    return out